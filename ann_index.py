@@ -0,0 +1,211 @@
+import os
+import sys
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.decomposition import TruncatedSVD
+from sklearn.random_projection import SparseRandomProjection
+
+# Default IVF shape, tuned with benchmarks/bench_ann_index.py at 100k and 1M jobs: about 4 * sqrt(n_jobs)
+# lists, of which 1/64 (at least 32) are scanned per query, and k-means trained on about 64 jobs per list
+LISTS_PER_SQRT_JOB = 4
+PROBED_LIST_FRACTION = 1 / 64
+MIN_PROBES = 32
+TRAINING_JOBS_PER_LIST = 64
+
+
+def _normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return (vectors / norms).astype(np.float32)
+
+
+class DenseJobIndex:
+    """
+    Approximate nearest-neighbour index over dense, reduced job vectors.
+
+    TF-IDF rows are reduced to n_components dimensions (TruncatedSVD, or a
+    sparse random projection when reducer="random"), L2-normalised and
+    stored as float32. Vectors are partitioned with k-means into n_lists
+    inverted lists (IVF) laid out contiguously; a query scans only the
+    n_probe lists whose centroids are closest, so latency depends on the
+    list size rather than the catalog size. Results are candidates for exact
+    TF-IDF and skill scoring, not final scores.
+
+    Args:
+        n_components (int): Dimensions of the dense vectors
+        n_lists (int): Number of IVF partitions (default: about 4 * sqrt(n_jobs))
+        n_probe (int): Lists scanned per query (default: 1/64 of the lists, at least 32)
+        reducer (str): "svd" or "random"
+        random_state (int): Seed for the reducer and k-means
+    """
+    def __init__(self, n_components=128, n_lists=None, n_probe=None, reducer="svd", random_state=0):
+        self.n_components = n_components
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.reducer = reducer
+        self.random_state = random_state
+
+    def fit(self, job_tfidf):
+        """
+        Build the index from a sparse TF-IDF job matrix.
+
+        Args:
+            job_tfidf (scipy.sparse matrix): One row per job
+
+        Returns:
+            DenseJobIndex: self
+        """
+        n_jobs, n_features = job_tfidf.shape
+        if self.reducer == "svd":
+            n_components = max(1, min(self.n_components, n_features - 1, n_jobs - 1))
+            reducer = TruncatedSVD(n_components=n_components, random_state=self.random_state)
+        else:
+            reducer = SparseRandomProjection(n_components=self.n_components, random_state=self.random_state)
+        reducer.fit(job_tfidf)
+
+        # Both reducers are a linear map; keeping just the matrix makes a saved index self-contained
+        components = reducer.components_
+        self.components = np.asarray(components.toarray() if sparse.issparse(components) else components, dtype=np.float32)
+        self.build(self.transform(job_tfidf))
+        return self
+
+    def build(self, vectors):
+        """
+        Partition already reduced, normalised float32 vectors into IVF lists.
+
+        Args:
+            vectors (numpy.ndarray): (n_jobs, n_components) job vectors
+        """
+        n_jobs = len(vectors)
+        n_lists = min(self.n_lists or max(1, int(LISTS_PER_SQRT_JOB * np.sqrt(n_jobs))), n_jobs)
+        self.n_probe = self.n_probe or min(n_lists, max(MIN_PROBES, int(n_lists * PROBED_LIST_FRACTION)))
+        kmeans = MiniBatchKMeans(n_clusters=n_lists, random_state=self.random_state, n_init=3,
+                                 batch_size=max(1024, n_lists * 4))
+        # Centroids are learnt from a sample; every job is then assigned to its nearest one
+        n_training = min(n_jobs, n_lists * TRAINING_JOBS_PER_LIST)
+        rng = np.random.default_rng(self.random_state)
+        kmeans.fit(vectors if n_training == n_jobs else vectors[np.sort(rng.choice(n_jobs, n_training, replace=False))])
+        assignments = kmeans.predict(vectors)
+
+        self.centroids = _normalize(kmeans.cluster_centers_)
+        order = np.argsort(assignments, kind="stable")
+        self.ids = order.astype(np.int64)
+        self.vectors = np.ascontiguousarray(vectors[order], dtype=np.float32)
+        self.offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=n_lists))])
+
+    def transform(self, tfidf):
+        """Reduce TF-IDF rows to normalised dense vectors; columns added after fitting are ignored."""
+        tfidf = sparse.csr_matrix(tfidf)[:, :self.components.shape[1]]
+        if tfidf.shape[1] < self.components.shape[1]:
+            tfidf.resize((tfidf.shape[0], self.components.shape[1]))
+        return _normalize(np.asarray(tfidf @ self.components.T))
+
+    def search_vectors(self, queries, k=10, n_probe=None):
+        """
+        Find approximate top-k jobs for reduced query vectors.
+
+        Args:
+            queries (numpy.ndarray): (n_queries, n_components) normalised vectors
+            k (int): Number of candidates per query
+            n_probe (int): Lists scanned (default: the index's n_probe)
+
+        Returns:
+            tuple: (ids, scores) arrays of shape (n_queries, k); missing slots hold -1 and -inf
+        """
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+
+        probes = np.argpartition(-(queries @ self.centroids.T), n_probe - 1, axis=1)[:, :n_probe]
+        for row, (query, lists) in enumerate(zip(queries, probes)):
+            # Lists are contiguous, so each one is scored in place rather than gathered into a copy
+            starts, ends = self.offsets[lists], self.offsets[lists + 1]
+            candidate_scores = np.concatenate([self.vectors[start:end] @ query for start, end in zip(starts, ends)])
+            if not len(candidate_scores):
+                continue
+            top = min(k, len(candidate_scores))
+            best = np.argpartition(-candidate_scores, top - 1)[:top]
+            best = best[np.argsort(-candidate_scores[best], kind="stable")]
+            # Position in the concatenated scores -> probed list -> row of self.vectors
+            list_ends = np.cumsum(ends - starts)
+            probed = np.searchsorted(list_ends, best, side="right")
+            ids[row, :top] = self.ids[starts[probed] + best - (list_ends[probed] - (ends - starts)[probed])]
+            scores[row, :top] = candidate_scores[best]
+        return ids, scores
+
+    def search(self, query_tfidf, k=10, n_probe=None):
+        """Find approximate top-k jobs for sparse TF-IDF query rows; see search_vectors."""
+        return self.search_vectors(self.transform(query_tfidf), k, n_probe)
+
+    def save(self, path):
+        """Save the index to an .npz file."""
+        np.savez(path, components=self.components, centroids=self.centroids, ids=self.ids,
+                 vectors=self.vectors, offsets=self.offsets, n_probe=self.n_probe)
+
+    @classmethod
+    def load(cls, path):
+        """Load an index saved with save()."""
+        with np.load(path) as data:
+            index = cls(n_components=data["vectors"].shape[1], n_lists=len(data["centroids"]), n_probe=int(data["n_probe"]))
+            index.components, index.centroids, index.ids, index.vectors, index.offsets = (
+                data["components"], data["centroids"], data["ids"], data["vectors"], data["offsets"]
+            )
+        return index
+
+
+def recall_at_k(approximate_ids, exact_ids):
+    """
+    Fraction of the exact top-k results that an approximate search returned.
+
+    Args:
+        approximate_ids (numpy.ndarray): (n_queries, k) ids from DenseJobIndex.search
+        exact_ids (numpy.ndarray): (n_queries, k) ids from an exact scan
+
+    Returns:
+        float: Mean recall@k over the queries
+    """
+    k = exact_ids.shape[1]
+    hits = [len(set(exact) & set(approximate)) for exact, approximate in zip(exact_ids, approximate_ids)]
+    return float(np.mean(hits)) / k
+
+
+def exact_top_k(job_tfidf, query_tfidf, k=10):
+    """Exact top-k rows of a TF-IDF job matrix for each query row, by brute-force scan."""
+    scores = np.asarray((query_tfidf @ job_tfidf.T).todense())
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+def search_job_index(job_index, dense_index, resume_text, top_k=10, n_candidates=200):
+    """
+    Two-stage retrieval: approximate candidates from the dense index, then
+    exact TF-IDF scoring of only those candidates in the JobIndex.
+
+    Args:
+        job_index (JobIndex): Exact index the dense index was built from
+        dense_index (DenseJobIndex): Approximate index over the same rows
+        resume_text (str): Plain text of the resume
+        top_k (int): Number of jobs to return
+        n_candidates (int): Candidates passed to exact scoring
+
+    Returns:
+        list: (job, similarity_score) pairs, best first
+    """
+    ids, _ = dense_index.search(job_index.query_tfidf(resume_text), n_candidates)
+    candidates = ids[0][ids[0] >= 0]
+    return job_index.match(resume_text, top_k, candidates)
+
+
+if __name__ == "__main__":
+    from job_index import JobIndex
+
+    job_index = JobIndex(sys.argv[1] if len(sys.argv) > 1 else "job_index")
+    job_tfidf = job_index.tfidf_matrix()
+    dense_index = DenseJobIndex().fit(job_tfidf)
+    dense_index.save(os.path.join(job_index.path, "dense.npz"))
+
+    sample = job_tfidf[np.random.default_rng(0).choice(job_tfidf.shape[0], min(100, job_tfidf.shape[0]), replace=False)]
+    k = min(10, job_tfidf.shape[0])
+    recall = recall_at_k(dense_index.search(sample, k)[0], exact_top_k(job_tfidf, sample, k))
+    print(f"Built dense index over {job_tfidf.shape[0]} jobs in {len(dense_index.centroids)} lists; "
+          f"recall@{k} against the exact scan: {recall:.3f}")
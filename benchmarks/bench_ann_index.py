@@ -0,0 +1,78 @@
+"""
+Query latency and recall of DenseJobIndex against an exact brute-force scan.
+
+Job vectors are synthetic: clustered, L2-normalised float32 vectors of the
+same shape DenseJobIndex stores after reduction, so catalogs far larger than
+linkedin_jobs.json can be measured. Queries are perturbed job vectors.
+
+    python benchmarks/bench_ann_index.py [--jobs N] [--dim D] [--queries Q] [--k K] [--lists L] [--probes 16,32,64]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from ann_index import DenseJobIndex, _normalize, recall_at_k
+
+
+def synthetic_vectors(n, dim, n_clusters, rng):
+    """Clustered unit vectors: random centres plus per-job noise."""
+    centres = rng.standard_normal((n_clusters, dim)).astype(np.float32)
+    vectors = centres[rng.integers(n_clusters, size=n)]
+    vectors += 0.5 * rng.standard_normal((n, dim)).astype(np.float32)
+    return _normalize(vectors)
+
+
+def exact_search(vectors, queries, k):
+    ids = np.empty((len(queries), k), dtype=np.int64)
+    for row, query in enumerate(queries):
+        scores = vectors @ query
+        top = np.argpartition(-scores, k - 1)[:k]
+        ids[row] = top[np.argsort(-scores[top], kind="stable")]
+    return ids
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=100_000, help="catalog size")
+    parser.add_argument("--dim", type=int, default=128, help="vector dimensions")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=None, help="IVF lists (default: the index's default)")
+    parser.add_argument("--probes", default="8,16,32,64,128", help="comma-separated n_probe values, besides the default")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    vectors = synthetic_vectors(args.jobs, args.dim, max(1, args.jobs // 500), rng)
+    queries = _normalize(vectors[rng.integers(args.jobs, size=args.queries)]
+                         + 0.3 * rng.standard_normal((args.queries, args.dim)).astype(np.float32))
+    print(f"{args.jobs} jobs x {args.dim} dims ({vectors.nbytes / 1024 / 1024:.0f} MB), {args.queries} queries, k={args.k}")
+
+    start = time.perf_counter()
+    index = DenseJobIndex(n_components=args.dim, n_lists=args.lists)
+    index.build(vectors)
+    print(f"build: {time.perf_counter() - start:.1f} s, {len(index.centroids)} lists, default n_probe={index.n_probe}")
+
+    start = time.perf_counter()
+    exact = exact_search(vectors, queries, args.k)
+    exact_ms = (time.perf_counter() - start) / args.queries * 1e3
+    print(f"{'exact scan':<14} {exact_ms:8.2f} ms/query  recall@{args.k} 1.000")
+
+    for n_probe in sorted({index.n_probe, *(int(p) for p in args.probes.split(","))}):
+        latencies = []
+        approximate = np.empty_like(exact)
+        for row, query in enumerate(queries):
+            start = time.perf_counter()
+            approximate[row] = index.search_vectors(query[None, :], args.k, n_probe)[0]
+            latencies.append(time.perf_counter() - start)
+        latencies = np.array(latencies) * 1e3
+        print(f"{'n_probe=' + str(n_probe):<14} {latencies.mean():8.2f} ms/query  "
+              f"recall@{args.k} {recall_at_k(approximate, exact):.3f}  "
+              f"p50 {np.percentile(latencies, 50):.2f} ms  p99 {np.percentile(latencies, 99):.2f} ms  "
+              f"speedup {exact_ms / latencies.mean():.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Near-duplicate detection benchmark on synthetic job corpora.
+
+Builds corpora with SyntheticCorpus (see bench_matcher.py) where a share of
+the documents are reposts of earlier ones with a few words changed, then
+times collapse_near_duplicates and reports how many reposts were found and
+how many distinct documents were wrongly merged.
+
+    python benchmarks/bench_dedup.py [--sizes 1000,10000,100000] [--repost-rate 0.3] [--edit-rate 0.02]
+"""
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+from bench_matcher import SyntheticCorpus
+from dedup import collapse_near_duplicates
+
+
+def build_jobs(corpus, size, job_words, repost_rate, edit_rate, rng):
+    """
+    Synthetic jobs and, for each, the index of the original it reposts (itself if none).
+    """
+    n_originals = max(1, int(size * (1 - repost_rate)))
+    descriptions = corpus.documents(n_originals, job_words)
+    origins = list(range(n_originals))
+    for _ in range(size - n_originals):
+        origin = int(rng.integers(n_originals))
+        words = descriptions[origin].split()
+        for position in rng.integers(len(words), size=max(1, int(len(words) * edit_rate))):
+            words[position] = corpus.words[rng.integers(len(corpus.words))]
+        descriptions.append(" ".join(words))
+        origins.append(origin)
+    jobs = [{"job_id": str(i), "title": f"Job {i}", "company": "Company", "location": "Remote",
+             "description": description} for i, description in enumerate(descriptions)]
+    return jobs, np.array(origins)
+
+
+def run_size(size, args):
+    rng = np.random.default_rng(args.seed)
+    corpus = SyntheticCorpus(args.jobs_file, seed=args.seed)
+    jobs, origins = build_jobs(corpus, size, args.job_words, args.repost_rate, args.edit_rate, rng)
+
+    start = time.perf_counter()
+    collapsed = collapse_near_duplicates(jobs, args.threshold)
+    elapsed = time.perf_counter() - start
+
+    # A canonical job's cluster should hold exactly the jobs with the same origin
+    label = np.empty(size, dtype=np.int64)
+    for job in collapsed:
+        label[int(job["job_id"])] = int(job["job_id"])
+        for variant in job["variants"]:
+            label[int(variant["job_id"])] = int(job["job_id"])
+    reposts = origins != np.arange(size)
+    found = np.mean(label[reposts] == label[origins[reposts]]) if reposts.any() else 1.0
+    false_merges = int(np.sum(origins[label] != origins))
+
+    return {"size": size, "seconds": elapsed, "jobs_per_second": size / elapsed,
+            "canonical": len(collapsed), "expected": int(np.sum(~reposts)),
+            "reposts_found": float(found), "false_merges": false_merges}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000", help="comma-separated corpus sizes")
+    parser.add_argument("--repost-rate", type=float, default=0.3, help="share of jobs that repost an earlier one")
+    parser.add_argument("--edit-rate", type=float, default=0.02, help="share of words changed in a repost")
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--job-words", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs-file", default=os.path.join(ROOT_DIR, "linkedin_jobs.json"))
+    args = parser.parse_args()
+
+    print(f"{'size':>9}{'seconds':>10}{'jobs/s':>10}{'canonical':>11}{'expected':>10}{'found':>8}{'false':>7}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        result = run_size(size, args)
+        print(f"{result['size']:>9}{result['seconds']:>10.2f}{result['jobs_per_second']:>10.0f}"
+              f"{result['canonical']:>11}{result['expected']:>10}{result['reposts_found']:>8.1%}{result['false_merges']:>7}")
+
+
+if __name__ == "__main__":
+    main()
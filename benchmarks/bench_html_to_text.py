@@ -0,0 +1,102 @@
+"""
+Micro-benchmark of html_to_text against the regex chain the scraper used before.
+
+The descriptions stored in linkedin_jobs.json are plain text, so each one is
+turned back into LinkedIn-style markup (paragraphs, bullet lists, line
+breaks, entities) before timing. The edge cases below are checked first and
+fail the run if html_to_text's output changes.
+
+    python benchmarks/bench_html_to_text.py [linkedin_jobs.json] [--repeat N]
+"""
+import os
+import re
+import sys
+import json
+import argparse
+import timeit
+from html import escape
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from html_to_text import html_to_text
+
+# Markup and the text html_to_text must turn it into
+EDGE_CASES = [
+    ("<p>Hello <b>big</b> world</p><p>Next&nbsp;para &amp; more</p>", "Hello big world\n\nNext para & more"),
+    ("<ul><li>One</li><li>Two<ul><li>Nested</li></ul></li></ul><p>After</p>", "• One\n• Two\n  • Nested\n\nAfter"),
+    ("<ol><li>a</li><li>b</li></ol>", "1. a\n2. b"),
+    ("<ul><li><p>Item one</p></li><li><p>Item two</p></li></ul>", "• Item one\n\n• Item two"),
+    ("<ul><li><div>A</div></li><li><br>B</li></ul>", "• A\n• B"),
+    ("Line<br>break<br><br><br>three", "Line\nbreak\n\nthree"),
+    ("<script>var x = '<p>';</script><style>p{}</style>Text<!-- c <p> -->after", "Textafter"),
+    ("a < b and &lt;b&gt; literal", "a < b and <b> literal"),
+    ("foo<b>bar</b> baz", "foobar baz"),
+    ("<P>Upper</P><BR/>x<br />y", "Upper\n\nx\ny"),
+]
+
+
+def check_edge_cases():
+    """Print every edge case whose output differs from the expected text; True if none does."""
+    ok = True
+    for markup, expected in EDGE_CASES:
+        text = html_to_text(markup)
+        if text != expected:
+            print(f"html_to_text({markup!r}) gave {text!r}, expected {expected!r}")
+            ok = False
+    return ok
+
+
+def legacy_clean(description):
+    """The sequential re.sub/str.replace chain previously run in extract_job_description."""
+    description = re.sub(r'<script[^>]*>.*?</script>', '', description, flags=re.DOTALL)
+    description = re.sub(r'<style[^>]*>.*?</style>', '', description, flags=re.DOTALL)
+    description = description.replace('<br>', '\n')
+    description = description.replace('<li>', '• ')
+    description = description.replace('</li>', '\n')
+    description = description.replace('<ul>', '\n').replace('</ul>', '\n')
+    description = description.replace('<p>', '').replace('</p>', '\n')
+    description = re.sub('<[^<]+?>', '', description)
+    description = re.sub(r'\n\s*\n', '\n\n', description)
+    description = re.sub(r' +', ' ', description)
+    return description.strip()
+
+
+def to_markup(text):
+    """Render a stored plain-text description as LinkedIn-like HTML."""
+    blocks = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        lines = [line.strip() for line in paragraph.splitlines() if line.strip()]
+        bullets = [line for line in lines if line.startswith(("•", "-", "*"))]
+        if lines and len(bullets) == len(lines):
+            items = "".join(f"<li>{escape(line.lstrip('•-* '))}</li>" for line in lines)
+            blocks.append(f"<ul>{items}</ul>")
+        elif lines:
+            blocks.append("<p>" + "<br>".join(f"<span>{escape(line)}</span>" for line in lines) + "</p>")
+    return "<!---->" + "".join(blocks) + "<!---->"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("jobs_file", nargs="?", default="linkedin_jobs.json")
+    parser.add_argument("--repeat", type=int, default=200, help="conversions per description per timing run")
+    args = parser.parse_args()
+
+    if not check_edge_cases():
+        sys.exit(1)
+
+    with open(args.jobs_file, "r", encoding="utf-8") as f:
+        documents = [to_markup(job["description"]) for job in json.load(f)]
+    total_kb = sum(len(document) for document in documents) / 1024
+    print(f"{len(documents)} descriptions, {total_kb:.1f} KB of markup")
+
+    results = {}
+    for name, clean in (("legacy regex chain", legacy_clean), ("html_to_text", html_to_text)):
+        best = min(timeit.repeat(lambda: [clean(document) for document in documents], number=args.repeat, repeat=5))
+        per_document = best / (args.repeat * len(documents)) * 1e6
+        results[name] = per_document
+        print(f"{name:<20} {per_document:9.1f} us/description  {total_kb * args.repeat / best / 1024:7.1f} MB/s")
+
+    print(f"speedup: {results['legacy regex chain'] / results['html_to_text']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
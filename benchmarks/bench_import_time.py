@@ -0,0 +1,135 @@
+"""
+Import-time benchmark for the Streamlit entry point.
+
+Imports the modules frontend/app.py needs before it can render, in a fresh
+interpreter under `python -X importtime`, and reports the wall time, the
+slowest top-level imports and whether any of the heavy dependencies that
+should load lazily (scikit-learn, Selenium, pandas, PyPDF2, docx2txt) were
+pulled in. Each run is appended to a JSONL results file and compared with
+the previous one.
+
+    python benchmarks/bench_import_time.py [--repeat N] [--top N] [--label TEXT]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+
+RESULTS_FILE = os.path.join(BENCH_DIR, "results", "bench_import_time.jsonl")
+# What frontend/app.py imports before its first st.* call
+APP_IMPORTS = ("streamlit", "utils", "scrape_queue", "resume_matcher", "job_store",
+               "caching", "metrics", "warmup", "ui_components")
+LAZY_MODULES = ("sklearn", "selenium", "webdriver_manager", "pandas", "PyPDF2", "docx2txt")
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def parse_importtime(stderr):
+    """
+    Cumulative microseconds of each top-level import in -X importtime output.
+
+    Returns:
+        dict: Module name to cumulative import time in seconds
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|", 2)
+        # Nested imports are indented under the module that triggered them
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        modules[name.strip()] = int(cumulative) / 1e6
+    return modules
+
+
+def measure_once(modules):
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"for name in {list(modules)!r}:\n"
+        "    __import__(name)\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(elapsed, *[name for name in {list(LAZY_MODULES)!r} if name in sys.modules])\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([ROOT_DIR, os.path.join(ROOT_DIR, "frontend")]))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT_DIR, env=env,
+                               capture_output=True, text=True, check=True)
+    elapsed, *loaded = completed.stdout.split()
+    return float(elapsed), loaded, parse_importtime(completed.stderr)
+
+
+def run(args):
+    # The first run also warms the OS file cache; the fastest of the rest is reported
+    measure_once(APP_IMPORTS)
+    runs = [measure_once(APP_IMPORTS) for _ in range(args.repeat)]
+    elapsed, loaded, modules = min(runs, key=lambda run: run[0])
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "label": args.label,
+        "python": sys.version.split()[0],
+        "seconds": elapsed,
+        "runs": [run[0] for run in runs],
+        "heavy_modules_loaded": loaded,
+        "top_imports": dict(sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top])
+    }
+
+
+def previous_result(path):
+    if not os.path.exists(path):
+        return None
+    previous = None
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                previous = json.loads(line)
+    return previous
+
+
+def report(result, previous):
+    print(f"\nApp imports: {result['seconds'] * 1e3:.0f} ms (best of {len(result['runs'])})")
+    print(f"Heavy modules loaded at import: {', '.join(result['heavy_modules_loaded']) or 'none'}")
+
+    print(f"\n{'module':<40}{'cumulative ms':>15}")
+    for name, seconds in result["top_imports"].items():
+        print(f"{name:<40}{seconds * 1e3:>15.1f}")
+
+    if previous:
+        change = result["seconds"] / previous["seconds"] - 1 if previous["seconds"] else 0.0
+        print(f"\nvs {previous['timestamp']} ({previous.get('revision') or 'unknown revision'}"
+              f"{', ' + previous['label'] if previous.get('label') else ''}): "
+              f"{previous['seconds'] * 1e3:.0f} -> {result['seconds'] * 1e3:.0f} ms ({change:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters measured")
+    parser.add_argument("--top", type=int, default=15, help="slowest top-level imports shown")
+    parser.add_argument("--results", default=RESULTS_FILE, help="JSONL file runs are appended to")
+    parser.add_argument("--label", default=None, help="note stored with the run, e.g. a branch name")
+    args = parser.parse_args()
+
+    result = run(args)
+    previous = previous_result(args.results)
+    report(result, previous)
+
+    os.makedirs(os.path.dirname(args.results), exist_ok=True)
+    with open(args.results, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result) + "\n")
+    print(f"\nSaved to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Matcher benchmark over synthetic corpora of increasing size.
+
+Job descriptions and resumes are generated from the word frequencies of
+linkedin_jobs.json, with skills from the SKILL_SET taxonomy mixed in, so the
+same seed always produces the same corpus. For each corpus size the script
+times building the matcher (TF-IDF fitting and job skills, as recorded by
+its own timers), TF-IDF transformation, similarity scoring, skill extraction
+and end-to-end ranking (scores, top-k and skill comparison of the top-k), and
+reports throughput, latency percentiles and the peak RSS of that size's run.
+
+    python benchmarks/bench_matcher.py [--sizes 10,100,1000,10000] [--output FILE]
+                                       [--baseline FILE --threshold 0.25]
+
+With --baseline, the run fails (exit status 1) if any stage's throughput
+dropped by more than the threshold against the baseline results.
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import resource
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+from metrics import REGISTRY
+from resume_matcher import BatchResumeMatcher, SKILL_EXTRACTOR, SKILL_SET, top_k_indices
+
+PERCENTILES = (50, 90, 99)
+
+
+class SyntheticCorpus:
+    """
+    Reproducible documents drawn from a real vocabulary.
+
+    Args:
+        jobs_file (str): Scraped jobs whose descriptions provide the vocabulary
+        seed (int): Random seed
+        skill_rate (float): Probability that a generated sentence names a skill
+    """
+    def __init__(self, jobs_file, seed=0, skill_rate=0.1):
+        with open(jobs_file, "r", encoding="utf-8") as f:
+            text = " ".join(job["description"] for job in json.load(f))
+        counts = Counter(re.findall(r"[A-Za-z][A-Za-z+#.-]*[A-Za-z+#]|[A-Za-z]", text.lower()))
+        self.words = np.array(list(counts))
+        frequencies = np.array(list(counts.values()), dtype=np.float64)
+        self.probabilities = frequencies / frequencies.sum()
+        self.rng = np.random.default_rng(seed)
+        self.skill_rate = skill_rate
+
+    def document(self, n_words, sentence_words=15):
+        words = self.words[self.rng.choice(len(self.words), size=n_words, p=self.probabilities)].tolist()
+        sentences = [" ".join(words[start:start + sentence_words]) for start in range(0, n_words, sentence_words)]
+        for i in np.flatnonzero(self.rng.random(len(sentences)) < self.skill_rate):
+            sentences[i] += " " + SKILL_SET[self.rng.integers(len(SKILL_SET))]
+        return ". ".join(sentences) + "."
+
+    def documents(self, count, n_words):
+        return [self.document(n_words) for _ in range(count)]
+
+
+def latency_stats(seconds):
+    seconds = np.asarray(seconds) * 1e3
+    return {f"p{q}_ms": float(np.percentile(seconds, q)) for q in PERCENTILES}
+
+
+def timer_seconds(name, before):
+    """Seconds recorded under a registry timer since the snapshot `before`."""
+    def total(snapshot):
+        return snapshot["timers"].get(name, {}).get("total", 0.0)
+    return total(REGISTRY.snapshot()) - total(before)
+
+
+def run_size(size, args):
+    """Benchmark one corpus size; runs in its own process so max RSS is per size."""
+    corpus = SyntheticCorpus(args.jobs_file, seed=args.seed)
+    jobs = corpus.documents(size, args.job_words)
+    resumes = corpus.documents(args.queries, args.resume_words)
+    stages = {}
+
+    # The matcher is built through its constructor; its steps are read back from the timers it records
+    before = REGISTRY.snapshot()
+    matcher = BatchResumeMatcher(jobs)
+    elapsed = timer_seconds("match.vectorize", before)
+    stages["vectorizer_fit"] = {"seconds": elapsed, "docs_per_second": size / elapsed}
+    elapsed = timer_seconds("match.job_skills", before)
+    stages["job_skills"] = {"seconds": elapsed, "docs_per_second": size / elapsed}
+
+    start = time.perf_counter()
+    matcher.vectorizer.transform(resumes)
+    elapsed = time.perf_counter() - start
+    stages["vectorizer_transform"] = {"seconds": elapsed, "docs_per_second": len(resumes) / elapsed}
+
+    timings = []
+    for document in jobs[:args.max_skill_docs]:
+        start = time.perf_counter()
+        SKILL_EXTRACTOR.extract(document)
+        timings.append(time.perf_counter() - start)
+    stages["skill_extraction"] = {"docs_per_second": len(timings) / sum(timings), **latency_stats(timings)}
+
+    timings = []
+    for resume in resumes:
+        start = time.perf_counter()
+        matcher.scores(resume)
+        timings.append(time.perf_counter() - start)
+    stages["similarity_scoring"] = {"queries_per_second": len(timings) / sum(timings),
+                                    "jobs_per_second": size * len(timings) / sum(timings), **latency_stats(timings)}
+
+    timings = []
+    for resume in resumes:
+        start = time.perf_counter()
+        scores = matcher.scores(resume)
+        matcher.match_rows(resume, top_k_indices(scores, args.top_k), scores)
+        timings.append(time.perf_counter() - start)
+    stages["end_to_end_ranking"] = {"queries_per_second": len(timings) / sum(timings), **latency_stats(timings)}
+
+    return {
+        "size": size,
+        "vocabulary": len(matcher.vectorizer.vocabulary_),
+        # ru_maxrss is in KB on Linux
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "stages": stages
+    }
+
+
+def throughput(stage):
+    """The stage's headline rate: higher is better."""
+    for name in ("docs_per_second", "queries_per_second"):
+        if name in stage:
+            return stage[name]
+
+
+def regressions(results, baseline, threshold):
+    """
+    Stages whose throughput dropped by more than threshold against a baseline run.
+
+    Returns:
+        list: Human-readable descriptions, empty if there are none
+    """
+    previous = {run["size"]: run for run in baseline["runs"]}
+    found = []
+    for run in results["runs"]:
+        if run["size"] not in previous:
+            continue
+        for name, stage in run["stages"].items():
+            before = previous[run["size"]]["stages"].get(name)
+            if not before:
+                continue
+            change = throughput(stage) / throughput(before) - 1
+            if change < -threshold:
+                found.append(f"{name} at {run['size']} docs: {throughput(before):.1f} -> {throughput(stage):.1f}/s ({change:+.0%})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="10,100,1000,10000", help="comma-separated corpus sizes (up to 1000000)")
+    parser.add_argument("--queries", type=int, default=50, help="resumes scored per size")
+    parser.add_argument("--job-words", type=int, default=300)
+    parser.add_argument("--resume-words", type=int, default=400)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--max-skill-docs", type=int, default=1000, help="documents timed individually for skill extraction")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--jobs-file", default=os.path.join(ROOT_DIR, "linkedin_jobs.json"))
+    parser.add_argument("--output", default=os.path.join(BENCH_DIR, "results", "bench_matcher.json"))
+    parser.add_argument("--baseline", help="earlier --output file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed throughput drop vs the baseline (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    results = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "params": vars(args), "runs": []}
+    print(f"{'size':>9} {'stage':<22}{'rate/s':>12}" + "".join(f"{f'p{q} ms':>10}" for q in PERCENTILES) + f"{'max RSS':>10}")
+    for size in (int(size) for size in args.sizes.split(",")):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            run = executor.submit(run_size, size, args).result()
+        results["runs"].append(run)
+        for name, stage in run["stages"].items():
+            print(f"{size:>9} {name:<22}{throughput(stage):>12.1f}"
+                  + "".join(f"{stage[f'p{q}_ms']:>10.2f}" if f"p{q}_ms" in stage else f"{'':>10}" for q in PERCENTILES)
+                  + f"{run['max_rss_mb']:>8.0f}MB")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nSaved to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            found = regressions(results, json.load(f), args.threshold)
+        if found:
+            print(f"\nRegressions beyond {args.threshold:.0%}:\n  " + "\n  ".join(found))
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Offline scraper benchmark against a local LinkedIn-like fixture server.
+
+Runs detect_job_cards_with_description end to end (headless Chrome, real
+waits and clicks) against benchmarks/linkedin_fixture.py, then reports
+jobs/second, per-step latency percentiles from the TimingProfile and peak
+memory. Each run is appended to a JSONL results file and compared with the
+previous run that used the same parameters.
+
+    python benchmarks/bench_scraper.py [--jobs N] [--workers W] [--latency S] [--label TEXT]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import tempfile
+import subprocess
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT_DIR)
+from linkedin_fixture import FixtureServer
+
+RESULTS_FILE = os.path.join(BENCH_DIR, "results", "bench_scraper.jsonl")
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def run(args):
+    with open(args.jobs_file, "r", encoding="utf-8") as f:
+        fixture_jobs = json.load(f)
+
+    with FixtureServer(fixture_jobs, total=args.jobs, latency=args.latency) as server:
+        # Read by scraper.py at import time
+        os.environ["LINKEDIN_BASE_URL"] = server.url
+        from scraper import SCRAPE_PREFIX, TimingProfile, detect_job_cards_with_description
+        from browser_pool import BrowserPool
+        from description_store import DescriptionStore
+
+        with tempfile.TemporaryDirectory() as workdir:
+            # Keeps save_job_listings from overwriting the repo's linkedin_jobs.json, and
+            # starts from an empty description store so every description is fetched
+            previous_dir = os.getcwd()
+            os.chdir(workdir)
+            pool = BrowserPool(size=args.workers)
+            profile = TimingProfile(SCRAPE_PREFIX)
+            tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                job_listings = detect_job_cards_with_description(
+                    "Benchmark", n=args.jobs, workers=args.workers, profile=profile, pool=pool,
+                    description_store=DescriptionStore(os.path.join(workdir, "descriptions.sqlite3"))
+                )
+            finally:
+                elapsed = time.perf_counter() - start
+                python_peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                pool.close()
+                os.chdir(previous_dir)
+        requests = server.requests
+
+    described = sum(job.get("description", "No Description Found") != "No Description Found" for job in job_listings)
+    steps = {
+        name: {"count": len(values), **{f"p{q}": percentile(values, q) for q in PERCENTILES}}
+        for name, values in profile.durations.items()
+    }
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "label": args.label,
+        "params": {"jobs": args.jobs, "workers": args.workers, "latency": args.latency},
+        "jobs_scraped": len(job_listings),
+        "jobs_described": described,
+        "requests": requests,
+        "seconds": elapsed,
+        "jobs_per_second": len(job_listings) / elapsed if elapsed else 0.0,
+        "python_peak_mb": python_peak / 1024 / 1024,
+        # ru_maxrss is in KB on Linux; browsers are separate processes and not included
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "steps": steps
+    }
+
+
+def previous_result(path, params):
+    if not os.path.exists(path):
+        return None
+    previous = None
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                result = json.loads(line)
+                if result["params"] == params:
+                    previous = result
+    return previous
+
+
+def report(result, previous):
+    print(f"\n{result['jobs_scraped']} jobs ({result['jobs_described']} with descriptions) in {result['seconds']:.1f} s "
+          f"over {result['requests']} requests: {result['jobs_per_second']:.2f} jobs/s")
+    print(f"memory: {result['python_peak_mb']:.1f} MB Python peak, {result['max_rss_mb']:.0f} MB max RSS")
+
+    print(f"\n{'step':<22}{'count':>7}" + "".join(f"{f'p{q} s':>10}" for q in PERCENTILES))
+    for name, stats in sorted(result["steps"].items(), key=lambda item: item[1]["p50"] * item[1]["count"], reverse=True):
+        print(f"{name:<22}{stats['count']:>7}" + "".join(f"{stats[f'p{q}']:>10.3f}" for q in PERCENTILES))
+
+    if previous:
+        change = result["jobs_per_second"] / previous["jobs_per_second"] - 1 if previous["jobs_per_second"] else 0.0
+        print(f"\nvs {previous['timestamp']} ({previous.get('revision') or 'unknown revision'}"
+              f"{', ' + previous['label'] if previous.get('label') else ''}): "
+              f"{previous['jobs_per_second']:.2f} -> {result['jobs_per_second']:.2f} jobs/s ({change:+.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50, help="result cards served and scraped")
+    parser.add_argument("--workers", type=int, default=1, help="browsers extracting descriptions")
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds added to every response")
+    parser.add_argument("--jobs-file", default=os.path.join(ROOT_DIR, "linkedin_jobs.json"), help="source of fixture jobs")
+    parser.add_argument("--results", default=RESULTS_FILE, help="JSONL file runs are appended to")
+    parser.add_argument("--label", default=None, help="note stored with the run, e.g. a branch name")
+    args = parser.parse_args()
+
+    result = run(args)
+    previous = previous_result(args.results, result["params"])
+    report(result, previous)
+
+    os.makedirs(os.path.dirname(args.results), exist_ok=True)
+    with open(args.results, "a", encoding="utf-8") as f:
+        f.write(json.dumps(result) + "\n")
+    print(f"\nSaved to {args.results}")
+
+
+if __name__ == "__main__":
+    main()
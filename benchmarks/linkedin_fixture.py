@@ -0,0 +1,181 @@
+"""
+Local HTTP server imitating the LinkedIn public job search pages.
+
+Serves a search page, infinite-scroll card batches and job pages built from
+linkedin_jobs.json, with the markup the scraper depends on: "base-card"
+result cards, the "show-more-less-html__markup" description with its "Show
+More" button, the "See more jobs" button and a dismissable sign-in modal.
+Each request can be delayed to mimic network latency.
+
+    with FixtureServer(jobs, total=50) as server:
+        os.environ["LINKEDIN_BASE_URL"] = server.url
+"""
+import os
+import re
+import sys
+import time
+import threading
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from bench_html_to_text import to_markup
+
+PAGE_SIZE = 25
+FIRST_JOB_ID = 4000000000
+
+MODAL = """
+<div class="artdeco-modal" role="dialog">
+  <p>Sign in to see more jobs</p>
+  <button class="artdeco-modal__dismiss" onclick="this.closest('.artdeco-modal').style.display='none'">&times;</button>
+</div>"""
+
+DESCRIPTION = """
+<div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5">{markup}</div>
+<button class="show-more-less-html__button show-more-less-html__button--more" aria-expanded="false"
+        onclick="this.setAttribute('aria-expanded', 'true'); this.previousElementSibling.classList.remove('show-more-less-html__markup--clamp-after-5')">Show more</button>"""
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html><head><title>{keywords} Jobs</title></head><body>
+{modal}
+<ul class="jobs-search__results-list" id="results">{cards}</ul>
+<button class="infinite-scroller__show-more-button" id="more" {more_style} onclick="loadMore()">See more jobs</button>
+<section class="details-pane" id="details"></section>
+<script>
+let start = {page_size};
+function loadMore() {{
+  fetch('/jobs/cards?start=' + start).then(r => r.text()).then(html => {{
+    document.getElementById('results').insertAdjacentHTML('beforeend', html);
+    start += {page_size};
+    if (start >= {total}) document.getElementById('more').style.display = 'none';
+  }});
+}}
+document.addEventListener('click', event => {{
+  const card = event.target.closest('.base-card');
+  if (!card) return;
+  const id = card.dataset.entityUrn.split(':').pop();
+  fetch('/jobs/description/' + id).then(r => r.text()).then(html => {{
+    document.getElementById('details').innerHTML = html;
+  }});
+}});
+</script>
+</body></html>"""
+
+JOB_PAGE = """<!DOCTYPE html>
+<html><head><title>{title}</title></head><body>
+{modal}
+<h1 class="top-card-layout__title">{title}</h1>
+<section class="description">{description}</section>
+</body></html>"""
+
+CARD = """
+<li><div class="base-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+  <a class="base-card__full-link" href="{base_url}/jobs/view/{slug}-{job_id}/"><span class="sr-only">{title}</span></a>
+  <h3 class="base-search-card__title">{title}</h3>
+  <h4 class="base-search-card__subtitle"><a href="#">{company}</a></h4>
+  <span class="job-search-card__location">{location}</span>
+  <time class="job-search-card__listdate" datetime="{date_posted}">Recently</time>
+</div></li>"""
+
+
+def slugify(text):
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+class FixtureServer:
+    """
+    Threaded fixture server on 127.0.0.1, usable as a context manager.
+
+    Args:
+        jobs (list): Job dicts (title, company, location, date_posted, description),
+            repeated as needed to fill the result list
+        total (int): Number of result cards the search returns
+        latency (float): Seconds each response is delayed
+        port (int): Port to bind (default: any free port)
+    """
+    def __init__(self, jobs, total=100, latency=0.0, port=0):
+        self.jobs = [dict(jobs[i % len(jobs)], job_id=str(FIRST_JOB_ID + i)) for i in range(total)]
+        self.by_id = {job["job_id"]: job for job in self.jobs}
+        self.markup = {}
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def description(self, job):
+        if job["job_id"] not in self.markup:
+            self.markup[job["job_id"]] = DESCRIPTION.format(markup=to_markup(job["description"]))
+        return self.markup[job["job_id"]]
+
+    def cards(self, start, count=PAGE_SIZE):
+        return "".join(
+            CARD.format(base_url=self.url, slug=slugify(job["title"]), job_id=job["job_id"],
+                        title=escape(job["title"]), company=escape(job["company"]),
+                        location=escape(job.get("location", "")), date_posted=escape(job.get("date_posted", "")))
+            for job in self.jobs[start:start + count]
+        )
+
+    def render(self, url):
+        """
+        Returns:
+            tuple: (status code, HTML) for a request path
+        """
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        path = parsed.path.rstrip("/")
+
+        if path == "/jobs/search":
+            return 200, SEARCH_PAGE.format(
+                keywords=escape(query.get("keywords", [""])[0]), modal=MODAL, cards=self.cards(0),
+                more_style="" if len(self.jobs) > PAGE_SIZE else "style='display:none'",
+                page_size=PAGE_SIZE, total=len(self.jobs)
+            )
+        if path == "/jobs/cards":
+            return 200, self.cards(int(query.get("start", ["0"])[0]))
+
+        match = re.fullmatch(r"/jobs/(?:description/|view/.*-)(\d+)", path)
+        job = self.by_id.get(match.group(1)) if match else None
+        if job is None:
+            return 404, "<html><body>Not found</body></html>"
+        if path.startswith("/jobs/description/"):
+            return 200, self.description(job)
+        return 200, JOB_PAGE.format(title=escape(job["title"]), modal=MODAL, description=self.description(job))
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                status, body = server.render(self.path)
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
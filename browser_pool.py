@@ -0,0 +1,145 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+import atexit
+import threading
+from contextlib import contextmanager
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def chromedriver_path():
+    """Resolve the ChromeDriver binary once per process instead of once per browser."""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+def setup_browser():
+    options = Options()
+    #add a piece of code to run this program without opening the browser
+    options.add_argument("--headless")  # Adding headless mode
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--window-size=1920,1080")
+
+    # Fix: Use Service object with ChromeDriverManager
+    service = Service(chromedriver_path())
+    browser = webdriver.Chrome(service=service, options=options)
+    return browser
+
+def is_healthy(browser):
+    """Check that a browser session still responds."""
+    try:
+        return browser.execute_script("return 1;") == 1
+    except Exception:
+        return False
+
+def _quit(browser):
+    try:
+        browser.quit()
+    except Exception:
+        pass
+
+class BrowserPool:
+    """
+    Bounded pool of long-lived headless browsers shared across searches.
+
+    Browsers are started lazily, health-checked when handed out, reset
+    between uses and restarted after max_uses searches or a crash, so warm
+    searches skip driver resolution and browser startup entirely.
+
+    Args:
+        size (int): Maximum number of browsers alive at once
+        max_uses (int): Number of uses after which a browser is restarted
+        factory (callable): Creates a new browser (default: setup_browser)
+    """
+    def __init__(self, size=4, max_uses=50, factory=setup_browser):
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory
+        self._idle = []
+        self._uses = {}
+        self._alive = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def _take(self):
+        with self._condition:
+            while not self._idle and self._alive >= self.size:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._alive += 1
+
+        try:
+            browser = self.factory()
+        except Exception:
+            self._discard(None)
+            raise
+        self._uses[id(browser)] = 0
+        return browser
+
+    def _discard(self, browser):
+        if browser is not None:
+            self._uses.pop(id(browser), None)
+            _quit(browser)
+        with self._condition:
+            self._alive -= 1
+            self._condition.notify()
+
+    def _reset(self, browser):
+        """Clear per-search state so the next search starts from a blank page."""
+        try:
+            browser.delete_all_cookies()
+            browser.get("about:blank")
+            return True
+        except Exception:
+            return False
+
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a browser for the duration of a with block.
+
+        Blocks while all browsers are in use. A browser that stopped
+        responding is replaced before it is handed out.
+        """
+        browser = self._take()
+        while not is_healthy(browser):
+            print("Restarting unresponsive browser")
+            self._discard(browser)
+            browser = self._take()
+
+        try:
+            yield browser
+        finally:
+            self._uses[id(browser)] += 1
+            if self._closed or self._uses[id(browser)] >= self.max_uses or not self._reset(browser):
+                self._discard(browser)
+            else:
+                with self._condition:
+                    self._idle.append(browser)
+                    self._condition.notify()
+
+    def close(self):
+        """Quit every idle browser. Browsers currently in use are quit on release."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            self._discard(browser)
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+def get_browser_pool():
+    """The process-wide BrowserPool used by the scraper unless one is passed in."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = BrowserPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
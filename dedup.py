@@ -0,0 +1,172 @@
+import string
+from itertools import count
+import numpy as np
+
+# Word n-grams compared between descriptions
+SHINGLE_SIZE = 3
+# Signature length and LSH bands. 192 hash functions keep the error of the similarity estimate
+# small enough that reposts with 2% of their words changed (Jaccard ~0.89) stay above the 0.8
+# threshold: 64 missed about 2% of them in benchmarks/bench_dedup.py
+NUM_PERM = 192
+BANDS = 32
+# Descriptions with fewer distinct shingles (placeholders such as
+# "No Description Found", or very short texts) are never collapsed
+MIN_SHINGLES = 10
+# Fields kept for each collapsed copy of a posting; descriptions are not
+VARIANT_FIELDS = ("title", "company", "location", "date_posted", "url", "job_id")
+# Shingles hashed per block; the (num_perm x block) working array stays cache-sized
+BLOCK_SHINGLES = 1 << 10
+
+# Punctuation is dropped before splitting into words (str.translate is much faster than a regex)
+_PUNCTUATION = str.maketrans({char: " " for char in string.punctuation})
+
+
+def _shingle_hashes(text, vocabulary, ids_source, shingle_size):
+    """Distinct 64-bit hashes of the word shingles of a text."""
+    # Word IDs only need to be unique, so new words take the next number of a shared counter;
+    # mapping setdefault keeps the per-word loop in C
+    ids = np.array(list(map(vocabulary.setdefault, text.lower().translate(_PUNCTUATION).split(), ids_source)), dtype=np.uint64)
+    if len(ids) < shingle_size:
+        return ids[:0]
+    hashes = np.zeros(len(ids) - shingle_size + 1, dtype=np.uint64)
+    for offset in range(shingle_size):
+        # Polynomial rolling hash; uint64 arithmetic wraps around
+        hashes = hashes * np.uint64(0x100000001B3) + ids[offset:len(ids) - shingle_size + 1 + offset] + np.uint64(1)
+    return np.unique(hashes)
+
+
+def minhash_signatures(texts, num_perm=NUM_PERM, shingle_size=SHINGLE_SIZE, min_shingles=MIN_SHINGLES, seed=0):
+    """
+    MinHash signatures of word-shingled texts.
+
+    Each of the num_perm hash functions is a multiply-shift hash of the
+    shingle hashes; the fraction of equal signature entries of two texts
+    estimates the Jaccard similarity of their shingle sets.
+
+    Args:
+        texts (iterable): Documents, e.g. job descriptions
+        num_perm (int): Hash functions per signature
+        shingle_size (int): Words per shingle
+        min_shingles (int): Texts with fewer distinct shingles get no signature
+        seed (int): Seed of the hash functions
+
+    Returns:
+        tuple: (signatures, valid) - a uint32 array of shape (n_texts, num_perm),
+            and a boolean mask of the texts that have a signature
+    """
+    rng = np.random.default_rng(seed)
+    # Odd multipliers make multiply-shift a universal family
+    a = rng.integers(1, 2 ** 63, size=(num_perm, 1), dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+    b = rng.integers(0, 2 ** 63, size=(num_perm, 1), dtype=np.uint64)
+
+    vocabulary, ids_source = {}, count()
+    shingles = [_shingle_hashes(text, vocabulary, ids_source, shingle_size) for text in texts]
+    valid = np.array([len(hashes) >= min_shingles for hashes in shingles], dtype=bool)
+    signatures = np.full((len(shingles), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+
+    # Signatures are computed for blocks of documents at once: one min-reduction per document segment
+    rows = np.flatnonzero(valid)
+    start = 0
+    while start < len(rows):
+        end, total = start, 0
+        while end < len(rows) and (end == start or total + len(shingles[rows[end]]) <= BLOCK_SHINGLES):
+            total += len(shingles[rows[end]])
+            end += 1
+        block = rows[start:end]
+        hashes = np.concatenate([shingles[row] for row in block])
+        offsets = np.cumsum([0] + [len(shingles[row]) for row in block[:-1]])
+        values = np.multiply(a, hashes)
+        values += b
+        values >>= np.uint64(32)
+        signatures[block] = np.minimum.reduceat(values, offsets, axis=1).T
+        start = end
+    return signatures, valid
+
+
+def near_duplicate_clusters(texts, threshold=0.8, num_perm=NUM_PERM, bands=BANDS, shingle_size=SHINGLE_SIZE,
+                            min_shingles=MIN_SHINGLES, seed=0):
+    """
+    Group texts whose estimated Jaccard similarity is at least threshold.
+
+    Signatures are split into bands and texts sharing any band are
+    candidates (locality-sensitive hashing). Within a band bucket every text
+    is compared with the bucket's first text only, so the work stays linear
+    in the number of texts even when thousands of copies share a bucket;
+    matches are joined transitively.
+
+    Args:
+        texts (list): Documents, e.g. job descriptions
+        threshold (float): Minimum estimated Jaccard similarity to join two texts
+        num_perm (int): Signature length; must be divisible by bands
+        bands (int): LSH bands; more bands find less similar candidates
+        shingle_size (int): Words per shingle
+        min_shingles (int): Shorter texts always stay on their own
+        seed (int): Seed of the hash functions
+
+    Returns:
+        numpy.ndarray: Cluster label per text: the index of the cluster's first text
+    """
+    if num_perm % bands:
+        raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+    signatures, valid = minhash_signatures(texts, num_perm, shingle_size, min_shingles, seed)
+    n = len(signatures)
+    parent = np.arange(n)
+    rows_per_band = num_perm // bands
+    candidates = np.flatnonzero(valid)
+
+    pairs = []
+    for band in range(bands):
+        keys = np.ascontiguousarray(signatures[candidates, band * rows_per_band:(band + 1) * rows_per_band])
+        _, first, inverse = np.unique(keys.view(np.dtype((np.void, keys.dtype.itemsize * rows_per_band))).ravel(),
+                                      return_index=True, return_inverse=True)
+        representative = candidates[first[inverse.ravel()]]
+        shared = representative != candidates
+        pairs.append(np.stack([representative[shared], candidates[shared]], axis=1))
+    pairs = np.unique(np.concatenate(pairs), axis=0) if pairs else np.empty((0, 2), dtype=np.int64)
+
+    if len(pairs):
+        agreement = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        pairs = pairs[agreement >= threshold]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i, j in pairs:
+        root_i, root_j = find(i), find(j)
+        if root_i != root_j:
+            # The earlier text becomes the root, so labels point at each cluster's first text
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    return np.array([find(i) for i in range(n)], dtype=np.int64)
+
+
+def collapse_near_duplicates(job_listings, threshold=0.8, **lsh_kwargs):
+    """
+    Collapse reposts of the same job into one canonical listing.
+
+    Jobs are compared by description. The first job of each cluster (the
+    best-placed in the search results) is kept, with the summary fields of
+    the others in its "variants" list.
+
+    Args:
+        job_listings (list): Job dicts with a "description"
+        threshold (float): Minimum estimated Jaccard similarity of two descriptions
+        **lsh_kwargs: Passed to near_duplicate_clusters, e.g. num_perm or bands
+
+    Returns:
+        list: Canonical jobs, in their original order
+    """
+    if len(job_listings) < 2:
+        return list(job_listings)
+    labels = near_duplicate_clusters([job.get("description") or "" for job in job_listings], threshold, **lsh_kwargs)
+
+    canonical = {}
+    for row, label in enumerate(labels.tolist()):
+        job = job_listings[row]
+        if label == row:
+            canonical[row] = dict(job, variants=list(job.get("variants") or []))
+        else:
+            canonical[label]["variants"].append({field: job.get(field) for field in VARIANT_FIELDS})
+    return list(canonical.values())
@@ -0,0 +1,79 @@
+import time
+import threading
+from scrape_cache import CACHE_PATH, connect
+
+MISSING_DESCRIPTION = "No Description Found"
+
+
+class DescriptionStore:
+    """
+    Local store of job descriptions keyed by LinkedIn job ID.
+
+    Postings rarely change once published, so the scraper looks descriptions
+    up here before clicking into a card and only fetches unseen postings.
+
+    Args:
+        path (str): SQLite database file (shared with the scrape cache by default)
+        max_age (float): Seconds after which a stored description is fetched again
+    """
+    def __init__(self, path=CACHE_PATH, max_age=7 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS descriptions ("
+                "job_id TEXT PRIMARY KEY, description TEXT, fetched_at REAL)"
+            )
+
+    def _connect(self):
+        return connect(self.path)
+
+    def get_many(self, job_ids):
+        """
+        Look up stored descriptions.
+
+        Args:
+            job_ids (iterable): LinkedIn job IDs
+
+        Returns:
+            dict: Description by job ID, for the IDs that are stored and fresh
+        """
+        job_ids = [job_id for job_id in set(job_ids) if job_id]
+        if not job_ids:
+            return {}
+        placeholders = ",".join("?" * len(job_ids))
+        with self._connect() as db:
+            rows = db.execute(
+                f"SELECT job_id, description FROM descriptions WHERE fetched_at >= ? AND job_id IN ({placeholders})",
+                [time.time() - self.max_age, *job_ids]
+            ).fetchall()
+        return dict(rows)
+
+    def get(self, job_id):
+        return self.get_many([job_id]).get(job_id)
+
+    def put(self, job_id, description):
+        """Store a freshly extracted description; failed extractions are not stored."""
+        if not job_id or not description or description == MISSING_DESCRIPTION:
+            return
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?)",
+                (job_id, description, time.time())
+            )
+
+    def __len__(self):
+        with self._connect() as db:
+            return db.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+def get_description_store():
+    """The process-wide DescriptionStore used by the scraper unless one is passed in."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = DescriptionStore()
+        return _default_store
@@ -1,15 +1,22 @@
 import streamlit as st
+import os
 import time
-import pandas as pd
 from utils import extract_text_from_file
-from scraper import detect_job_cards_with_description
-from resume_matcher import ResumeMatcher
+from scrape_queue import get_scrape_queue, QUEUED, RUNNING, FAILED
+from search_plan import split_terms
+from job_store import JobStore
+from dedup import collapse_near_duplicates
+from caching import content_hash, results_version, get_matcher, page_results, preview_scores
+from metrics import REGISTRY, TimingProfile, increment, serve_prometheus, timer
+from warmup import start_warmup
 from ui_components import (
     apply_custom_styles, 
     render_job_card, 
+    render_job_preview,
     render_loading_animation,
     render_search_tips,
     render_no_results_message,
+    render_timing_panel,
     render_footer
 )
 
@@ -24,15 +31,40 @@ st.set_page_config(
 # Apply custom styles
 apply_custom_styles()
 
+# Optional Prometheus endpoint; started once per process
+if os.environ.get("METRICS_PORT"):
+    serve_prometheus()
+
 # Initialize session state for job listings if it doesn't exist
-if 'job_listings' not in st.session_state:
-    st.session_state.job_listings = []
+if 'job_store' not in st.session_state:
+    st.session_state.job_store = JobStore()
 
 if 'search_performed' not in st.session_state:
     st.session_state.search_performed = False
 
-if 'loading' not in st.session_state:
-    st.session_state.loading = False
+# Key of the background scrape this session is waiting for, if any
+if 'scrape_key' not in st.session_state:
+    st.session_state.scrape_key = None
+
+if 'cached_at' not in st.session_state:
+    st.session_state.cached_at = None
+
+# Step timings of the current search: scraping (from the queue) and de-duplication (this session)
+if 'scrape_timings' not in st.session_state:
+    st.session_state.scrape_timings = {}
+
+if 'search_profile' not in st.session_state:
+    st.session_state.search_profile = TimingProfile()
+
+# Timings of the latest ranking and rendering of the results, replaced on every render
+if 'results_profile' not in st.session_state:
+    st.session_state.results_profile = TimingProfile()
+
+# Timings of this run only, so reruns never pile up entries
+run_profile = TimingProfile()
+
+if 'results_page' not in st.session_state:
+    st.session_state.results_page = 0
 
 # Header
 st.markdown("<h1 class='main-header'>🔍 LinkedIn Job Scraper with Resume Matcher</h1>", unsafe_allow_html=True)
@@ -47,7 +79,7 @@ with col1:
     keyword = st.text_input(
         "Enter job title or keyword:", 
         placeholder="e.g., Data Scientist, Web Developer",
-        help="Enter the job title or relevant keywords to search on LinkedIn"
+        help="Enter the job title or relevant keywords to search on LinkedIn. Separate several with commas to search them all at once"
     )
     
     # Additional filters in an expander
@@ -55,7 +87,7 @@ with col1:
         location = st.text_input(
             "Location:", 
             placeholder="e.g., New York, Remote",
-            help="Specify a location or enter 'Remote' for remote positions"
+            help="Specify a location or enter 'Remote' for remote positions. Separate several with commas to search each of them"
         )
         
         col_exp1, col_exp2 = st.columns(2)
@@ -119,7 +151,8 @@ with col2:
             """, unsafe_allow_html=True)
             
             try:
-                resume_text = extract_text_from_file(resume_file)
+                with timer("ui.resume_extract", run_profile):
+                    resume_text = extract_text_from_file(resume_file)
                 st.success("✅ Resume successfully processed!")
             except Exception as e:
                 st.error(f"❌ Error processing file: {str(e)}")
@@ -144,91 +177,163 @@ with search_col1:
 # Search tips
 render_search_tips()
 
-# Handle search button click
+def land_scrape_results(status, resume_text):
+    """Move a finished background scrape into this session's results."""
+    st.session_state.scrape_key = None
+    if status is None or status["state"] == FAILED:
+        error = status["error"] if status else "the search was dropped"
+        st.session_state.scrape_error = f"Error during job search: {error}"
+        st.session_state.job_store = JobStore()
+        return
+    
+    # Reposts of the same job are matched and rendered once, as one card listing its variants
+    profile = TimingProfile()
+    with timer("dedup.collapse", profile):
+        job_listings = collapse_near_duplicates(status["job_listings"])
+    st.session_state.duplicates_collapsed = len(status["job_listings"]) - len(job_listings)
+    # A new version invalidates the matcher and scores cached for earlier results
+    st.session_state.job_store = JobStore.from_jobs(job_listings)
+    st.session_state.results_version = results_version(job_listings)
+    st.session_state.ranked_resume = resume_text
+    st.session_state.results_page = 0
+    st.session_state.cached_at = status["cached_at"]
+    st.session_state.scrape_timings = {"scrape." + name: stats for name, stats in status["timings"].items()}
+    st.session_state.search_profile = profile
+    st.session_state.results_profile = TimingProfile()
+
+# Handle search button click: the scrape runs in the background queue, shared by every session
 if search_button:
-    if keyword.strip():
-        st.session_state.loading = True
+    keywords = split_terms(keyword)
+    if keywords:
         st.session_state.search_performed = True
+        st.session_state.scrape_error = None
+        scrape_queue = get_scrape_queue()
+        # Several keywords or locations run as one search plan, with overlapping postings scraped once
+        # The advanced options are applied by LinkedIn's own search filters
+        st.session_state.scrape_key = scrape_queue.submit(keywords, n=results_limit, location=split_terms(location),
+                                                          experience_levels=experience_level, job_types=job_type)
         
-        with st.spinner("Fetching and analyzing job listings... This may take a moment."):
-            # Loading animation
-            render_loading_animation()
-            
-            # Call the scraper
-            try:
-                job_listings = detect_job_cards_with_description(keyword)
-                
-                # Process results if we have any
-                if job_listings:
-                    # Resume matcher
-                    for job in job_listings:
-                        if resume_text:
-                            matcher = ResumeMatcher(job["description"])
-                            match_result = matcher.match_resume(resume_text)
-                            job["similarity_score"] = match_result["similarity_score"]
-                            job["missing_skills"] = match_result["missing_skills"]
-                            job["matched_skills"] = match_result.get("matched_skills", [])
-                        else:
-                            job["similarity_score"] = 0
-                            job["missing_skills"] = []
-                            job["matched_skills"] = []
-                    
-                    # Sorting by % match if resume provided
-                    if resume_text:
-                        job_listings.sort(key=lambda x: x["similarity_score"], reverse=True)
-                    
-                    st.session_state.job_listings = job_listings
-                else:
-                    st.session_state.job_listings = []
-            except Exception as e:
-                st.error(f"Error during job search: {str(e)}")
-                st.session_state.job_listings = []
-        
-        st.session_state.loading = False
+        # Searches already in the scrape cache finish immediately
+        status = scrape_queue.status(st.session_state.scrape_key)
+        if status is None or status["state"] not in (QUEUED, RUNNING):
+            land_scrape_results(status, resume_text)
     else:
         st.error("⚠️ Please enter a valid job keyword to start your search.")
 
-# Display results if search was performed
-if st.session_state.search_performed:
-    if st.session_state.job_listings:
-        st.markdown(f"<div class='section-header'>📊 Results: Found {len(st.session_state.job_listings)} Job Listings</div>", unsafe_allow_html=True)
+@st.fragment(run_every=1.0)
+def render_scrape_progress(resume_text):
+    """
+    Poll the background scrape once a second, showing each job as soon as its
+    description arrives; reruns the whole app once the results land.
+    """
+    status = get_scrape_queue().status(st.session_state.scrape_key)
+    if status is None or status["state"] not in (QUEUED, RUNNING):
+        land_scrape_results(status, resume_text)
+        st.rerun()
+    
+    render_loading_animation()
+    if status["state"] == QUEUED:
+        st.markdown("<div class='section-header'>⏳ Waiting for a free browser...</div>", unsafe_allow_html=True)
+    else:
+        st.markdown(f"<div class='section-header'>⏳ Found {status['found']} of {status['requested']} jobs so far...</div>", unsafe_allow_html=True)
+    
+    job_listings = status["job_listings"]
+    scores = None
+    if job_listings and resume_text.strip():
+        # Provisional scores from one model over the partial results, re-fitted only when a job arrives
+        scores = preview_scores(results_version(job_listings), content_hash(resume_text), job_listings, resume_text)
+    for idx, job in enumerate(job_listings):
+        render_job_preview(job, None if scores is None else float(scores[idx]))
+
+@st.fragment
+def render_results(resume_text):
+    """
+    Results section. As a fragment, widget clicks inside it (paging, "Apply Now")
+    rerun only this function, and the ranked page comes from the cache.
+    """
+    job_store = st.session_state.job_store
+    st.markdown(f"<div class='section-header'>📊 Results: Found {len(job_store)} Job Listings</div>", unsafe_allow_html=True)
+    if st.session_state.get("duplicates_collapsed"):
+        st.caption(f"{st.session_state.duplicates_collapsed} reposts of listed jobs were merged into their first listing.")
+    
+    # Rank only the current page: work below depends on the page size, not the number of jobs
+    page_col1, page_col2 = st.columns([1, 1])
+    with page_col1:
+        page_size = st.selectbox("Results per page:", [10, 25, 50, 100], index=0)
+    page_count = -(-len(job_store) // page_size)
+    with page_col2:
+        page = st.number_input("Page:", min_value=1, max_value=page_count,
+                               value=min(st.session_state.results_page + 1, page_count), step=1) - 1
+    st.session_state.results_page = page
+    
+    version = st.session_state.results_version
+    ranked_resume = st.session_state.ranked_resume
+    resume_key = content_hash(ranked_resume) if ranked_resume.strip() else ""
+    profile = st.session_state.results_profile = TimingProfile()
+    with timer("match.get_matcher", profile):
+        matcher = get_matcher(version, job_store)
+    with timer("match.page_results", profile):
+        page_rows, page_jobs = page_results(version, resume_key, page_size, page, job_store, matcher, ranked_resume)
+    
+    tab1, tab2 = st.tabs(["Card View", "Table View"])
+    
+    with tab1, timer("ui.render_cards", profile):
+        for row, job in zip(page_rows, page_jobs):
+            render_job_card(job, row, resume_text)
+    
+    with tab2, timer("ui.render_table", profile):
+        job_df = job_store.to_dataframe(page_rows)
         
-        tab1, tab2 = st.tabs(["Card View", "Table View"])
+        # Determine which columns to display
+        display_cols = ["title", "company", "location"]
+        if resume_text and resume_key:
+            job_df["match_percentage"] = [f"{job['similarity_score']:.0%}" for job in page_jobs]
+            display_cols.append("match_percentage")
         
-        with tab1:
-            for idx, job in enumerate(st.session_state.job_listings):
-                render_job_card(job, idx, resume_text)
+        display_cols.append("date_posted")
         
-        with tab2:
-            job_df = pd.DataFrame(st.session_state.job_listings)
-            
-            if "similarity_score" in job_df.columns and resume_text:
-                job_df["match_percentage"] = job_df["similarity_score"].apply(lambda x: f"{x:.0%}")
-            
-            # Determine which columns to display
-            display_cols = ["title", "company", "location"]
-            if resume_text and "match_percentage" in job_df.columns:
-                display_cols.append("match_percentage")
-            
-            if "date_posted" in job_df.columns:
-                display_cols.append("date_posted")
-            
-            # Create a more user-friendly table
-            st.dataframe(
-                job_df[display_cols],
-                use_container_width=True,
-                column_config={
-                    "title": "Job Title",
-                    "company": "Company",
-                    "location": "Location",
-                    "match_percentage": "Match Score",
-                    "date_posted": "Date Posted"
-                },
-                hide_index=True
-            )
-    elif not st.session_state.loading:
+        # Create a more user-friendly table
+        st.dataframe(
+            job_df[display_cols],
+            use_container_width=True,
+            column_config={
+                "title": "Job Title",
+                "company": "Company",
+                "location": "Location",
+                "match_percentage": "Match Score",
+                "date_posted": "Date Posted"
+            },
+            hide_index=True
+        )
+
+# Display results if search was performed
+if st.session_state.search_performed:
+    if st.session_state.scrape_key:
+        render_scrape_progress(resume_text)
+    elif st.session_state.get("scrape_error"):
+        st.error(st.session_state.scrape_error)
+    elif len(st.session_state.job_store):
+        if st.session_state.cached_at:
+            fetched_minutes = (time.time() - st.session_state.cached_at) / 60
+            st.info(f"⚡ Showing cached results fetched {fetched_minutes:.0f} min ago.")
+        # An edited or newly uploaded resume re-ranks the results in place: the cached
+        # matcher keeps the job TF-IDF matrix and job skills, so only the resume is vectorized
+        if resume_text != st.session_state.ranked_resume:
+            st.session_state.ranked_resume = resume_text
+            st.session_state.results_page = 0
+            increment("match.rescores")
+        render_results(resume_text)
+    else:
         # Show no results message
         render_no_results_message()
 
+if st.session_state.search_performed:
+    render_timing_panel({**st.session_state.scrape_timings, **st.session_state.search_profile.summary(),
+                         **st.session_state.results_profile.summary(), **run_profile.summary()},
+                        REGISTRY.snapshot())
+
 # Footer
-render_footer()
\ No newline at end of file
+render_footer()
+
+# Everything above has been sent to the browser; load the heavy dependencies in the background
+start_warmup()
\ No newline at end of file
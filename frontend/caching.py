@@ -0,0 +1,76 @@
+import json
+import hashlib
+import streamlit as st
+from resume_matcher import BatchResumeMatcher, top_k_indices
+
+# Cached results are keyed by content hashes rather than per-session counters:
+# st.cache_resource and st.cache_data are shared by every session of the process.
+
+
+def content_hash(text):
+    """Hex digest identifying a piece of text, e.g. a resume."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def results_version(job_listings):
+    """
+    Version of a scrape result, used to invalidate everything derived from it.
+
+    A new scrape with different jobs gets a new version, so matchers and
+    scores cached for the previous results are no longer looked up and age
+    out of the caches below.
+    """
+    return content_hash(json.dumps(job_listings, sort_keys=True, ensure_ascii=False))
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_matcher(version, _job_store):
+    """BatchResumeMatcher (fitted vectorizer and job skills) for one scrape result, built once per process."""
+    return BatchResumeMatcher(_job_store.descriptions())
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def match_scores(version, resume_key, _matcher, _resume_text):
+    """Similarity of every job in a result to a resume, cached by (results version, resume hash)."""
+    return _matcher.scores(_resume_text)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def preview_scores(version, resume_key, _job_listings, _resume_text):
+    """
+    Provisional scores of a scrape still in progress, one model over the jobs found so far.
+
+    Cached by the partial result's results_version, so progress polls only
+    re-fit when a new job has arrived.
+    """
+    return BatchResumeMatcher(job["description"] for job in _job_listings).scores(_resume_text)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def page_results(version, resume_key, page_size, page, _job_store, _matcher, _resume_text):
+    """
+    Rank and materialize one page of results.
+
+    Args:
+        version (str): results_version of the job store
+        resume_key (str): content_hash of the resume text ("" when there is none)
+        page_size (int): Jobs per page
+        page (int): Zero-based page number
+        _job_store (JobStore): Scraped jobs (not hashed; identified by version)
+        _matcher (BatchResumeMatcher): Matcher from get_matcher
+        _resume_text (str): Resume text (not hashed; identified by resume_key)
+
+    Returns:
+        tuple: (rows, jobs) for the page, best first; jobs are dicts with the
+            match score and skills attached
+    """
+    offset = page * page_size
+    if resume_key:
+        scores = match_scores(version, resume_key, _matcher, _resume_text)
+        rows = top_k_indices(scores, page_size, offset).tolist()
+    else:
+        scores = None
+        rows = list(range(offset, min(offset + page_size, len(_job_store))))
+
+    matches = _matcher.match_rows(_resume_text, rows, scores)
+    return rows, [{**_job_store[row], **match_result} for row, match_result in zip(rows, matches)]
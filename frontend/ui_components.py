@@ -297,6 +297,12 @@ def render_job_card(job, idx, resume_text=""):
         with st.expander("📝 View Job Description"):
             st.write(job["description"])
         
+        if job.get("variants"):
+            with st.expander(f"🔁 Also posted {len(job['variants'])} more time(s)"):
+                for variant in job["variants"]:
+                    listing = f"**{variant['title']}** · {variant['company']} · {variant.get('location') or 'Location not specified'}"
+                    st.markdown(f"{listing} · [View]({variant['url']})" if variant.get("url") else listing)
+        
         if resume_text:
             with st.expander("🧩 Skills Analysis"):
                 skill_col1, skill_col2 = st.columns(2)
@@ -329,6 +335,27 @@ def render_job_card(job, idx, resume_text=""):
         
         st.markdown("<hr style='margin: 30px 0; border-color: #eee;'>", unsafe_allow_html=True)
 
+def render_job_preview(job, score=None):
+    """
+    Render a compact, widget-free summary of a job while a search is still running
+    
+    Args:
+        job (dict): Job listing information
+        score (float): Provisional match score, if a resume was provided
+    """
+    score_html = ""
+    if score is not None:
+        score_class = "match-score-high" if score >= 0.7 else "match-score-medium" if score >= 0.4 else "match-score-low"
+        score_html = f"<span class='{score_class}'>{score:.0%}</span>"
+    
+    st.markdown(f"""
+    <div class='job-card'>
+        <h3 class='job-title'>{job["title"]}</h3>
+        <p class='company-name'>🏢 {job["company"]}</p>
+        <p class='job-location'>📍 {job.get("location", "Location not specified")} {score_html}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
 def render_loading_animation():
     """Display a loading animation while processing jobs"""
     st.markdown("""
@@ -367,6 +394,38 @@ def render_no_results_message():
     </div>
     """, unsafe_allow_html=True)
 
+def render_timing_panel(search_timings, process_metrics):
+    """
+    Render the latency breakdown of the current search and of the whole process
+    
+    Args:
+        search_timings (dict): Per-step summaries (count, total, mean, p95, max) for this search
+        process_metrics (dict): Snapshot of the metrics registry ("timers" and "counters")
+    """
+    with st.expander("🛠️ Latency breakdown (debug)"):
+        st.markdown("**This search**")
+        if search_timings:
+            rows = sorted(search_timings.items(), key=lambda item: item[1]["total"], reverse=True)
+            st.dataframe(
+                [{"step": name, "count": stats["count"], "total s": round(stats["total"], 3),
+                  "mean s": round(stats["mean"], 3), "p95 s": round(stats["p95"], 3)} for name, stats in rows],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("No timings recorded yet.")
+        
+        st.markdown("**Since the app started**")
+        timers = sorted(process_metrics["timers"].items(), key=lambda item: item[1]["p95"] * item[1]["count"], reverse=True)
+        st.dataframe(
+            [{"step": name, "count": stats["count"], "p50 s": round(stats["p50"], 3),
+              "p95 s": round(stats["p95"], 3), "max s": round(stats["max"], 3)} for name, stats in timers],
+            use_container_width=True,
+            hide_index=True
+        )
+        if process_metrics["counters"]:
+            st.json(process_metrics["counters"])
+
 def render_footer():
     """Render the application footer"""
     st.markdown("""
@@ -1,30 +1,20 @@
 ##Not yet working for pdf uploads..some documents have issues
-import io
-import PyPDF2
-import docx2txt
+from resume_ingest import extract_resume_text, extract_text_from_path
 
 def extract_text_from_file(file):
     """
     Extract text from various file formats (PDF, DOCX, TXT)
     
+    PDFs are read page by page and the result is cached by a hash of the
+    file contents, so Streamlit reruns with the same upload cost nothing.
+    
     Args:
         file: The uploaded file object
         
     Returns:
         str: Extracted text from the file
     """
-    file_type = file.type
-    
-    if file_type == "application/pdf":
-        pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
-    elif file_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        return docx2txt.process(file)
-    else:
-        return io.StringIO(file.getvalue().decode("utf-8")).read()
+    return extract_resume_text(file.getvalue(), file.type)
     
 if __name__=='__main__':
-    print(extract_text_from_file('resume.pdf'))
\ No newline at end of file
+    print(extract_text_from_path('resume.pdf'))
\ No newline at end of file
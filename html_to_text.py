@@ -0,0 +1,128 @@
+from html import unescape
+
+_PARAGRAPH_TAGS = {"p", "h1", "h2", "h3", "h4", "h5", "h6", "table", "blockquote", "pre"}
+_LINE_TAGS = {"div", "tr", "section", "article", "header", "footer"}
+_LIST_TAGS = {"ul", "ol"}
+
+_SKIPPED_TAGS = ("script", "style")
+
+
+def _parse_tag(tag):
+    """(closing, lower-cased name) of a tag body such as "/li", "br/" or 'a href="..."'; name is "" if not a tag."""
+    closing = tag.startswith("/")
+    name = tag[closing:]
+    if not name[:1].isalpha():
+        return closing, ""
+    return closing, name.split(None, 1)[0].rstrip("/").lower()
+
+
+# Bare tags ("p", "/li", "span", ...) make up nearly all job description markup; they skip _parse_tag
+_BARE_TAGS = {tag: _parse_tag(tag) for name in sorted(_PARAGRAPH_TAGS | _LINE_TAGS | _LIST_TAGS | set(_SKIPPED_TAGS)
+                                                       | {"li", "br", "span", "strong", "b", "em", "i", "u", "a"})
+              for tag in (name, "/" + name)}
+
+
+def html_to_text(markup):
+    """
+    Convert job description HTML to normalised plain text in a single pass.
+
+    The markup is split once at every "<"; each piece is a tag followed by
+    the text up to the next tag, so the loop runs once per tag and writes
+    the final text directly: entities are decoded and whitespace collapsed
+    per text run, and layout is emitted as it is met, with no clean-up
+    passes afterwards. Scripts, styles and comments are dropped.
+    Paragraph-level tags become blank lines, list items become "• "
+    bullets ("1. " in ordered lists) indented by nesting depth.
+
+    Args:
+        markup (str): HTML fragment, e.g. a description container's innerHTML
+
+    Returns:
+        str: Plain text
+    """
+    pieces = markup.split("<")
+    parts = []
+    pending_break = 0       # newlines owed before the next text: 0, 1 or 2
+    pending_space = False   # whitespace seen since the last word
+    line_start = True       # nothing written yet, or only a bullet, on the current line
+    lists = []              # one entry per open list: None for <ul>, item counter for <ol>
+    skip_until = None       # closing marker of a script, style or comment being skipped
+
+    for i, piece in enumerate(pieces):
+        if not i:
+            text = piece
+        elif skip_until is not None:
+            if skip_until == "-->":
+                end = piece.find("-->")
+                if end < 0:
+                    continue
+                text = piece[end + 3:]
+            elif piece[:len(skip_until)].lower() == skip_until:
+                text = piece.partition(">")[2]
+            else:
+                continue
+            skip_until = None
+        elif piece.startswith("!--"):
+            end = piece.find("-->", 3)
+            if end < 0:
+                skip_until = "-->"
+                continue
+            text = piece[end + 3:]
+        else:
+            tag, closed, text = piece.partition(">")
+            closing, name = _BARE_TAGS.get(tag) or _parse_tag(tag)
+            if not closed or not name:
+                # A stray "<" is text, as the browser would show it
+                text = "<" + piece
+            elif name in _SKIPPED_TAGS:
+                if not closing:
+                    skip_until = "/" + name
+                continue
+            elif name == "li":
+                pending_break = max(pending_break, 1)
+                if not closing:
+                    if lists and lists[-1] is not None:
+                        lists[-1] += 1
+                        bullet = f"{lists[-1]}. "
+                    else:
+                        bullet = "• "
+                    if parts:
+                        parts.append("\n" * pending_break)
+                    parts.append("  " * max(len(lists) - 1, 0) + bullet)
+                    pending_break, pending_space, line_start = 0, False, True
+            elif name in _LIST_TAGS:
+                if not closing:
+                    lists.append(0 if name == "ol" else None)
+                elif lists:
+                    lists.pop()
+                pending_break = max(pending_break, 1 if lists else 2)
+            elif line_start:
+                # A bullet and its text stay on one line: <li><p>Item</p></li> is "• Item"
+                pass
+            elif name == "br":
+                pending_break = min(pending_break + 1, 2)
+            elif name in _PARAGRAPH_TAGS:
+                pending_break = 2
+            elif name in _LINE_TAGS:
+                pending_break = max(pending_break, 1)
+            # Inline tags (span, strong, a, ...) only end the tag; their text runs on
+
+        if not text:
+            continue
+        if "&" in text:
+            text = unescape(text)
+        words = text.split()
+        if not words:
+            pending_space = True
+            continue
+        if pending_break:
+            if parts:
+                parts.append("\n" * pending_break)
+            pending_break, line_start = 0, True
+        elif not line_start and (pending_space or text[0].isspace()):
+            parts.append(" ")
+        parts.append(" ".join(words))
+        pending_space = text[-1].isspace()
+        line_start = False
+
+    return "".join(parts)
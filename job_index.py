@@ -0,0 +1,343 @@
+import os
+import sys
+import json
+from collections import Counter
+from datetime import date
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+from resume_matcher import top_k_indices
+# Shared with the scraper's search plans, so a job has one identity everywhere
+from search_plan import job_key
+
+INDEX_DIR = "job_index"
+
+# Raw, append-only arrays backing the CSR matrix of term counts. They are
+# memory-mapped on load, so opening a large index costs no parsing.
+_ARRAYS = {
+    "data": np.float32,     # term counts, row-major
+    "indices": np.int32,    # column (term id) of each count
+    "rows": np.int32,       # row of each count, kept for vectorised scoring
+    "indptr": np.int64,     # CSR row pointer, n_rows + 1 entries
+    "alive": np.uint8,      # 0 once a job has been removed
+}
+
+
+class JobIndex:
+    """
+    On-disk TF-IDF index of scraped jobs with incremental add and remove.
+
+    The index stores raw term counts in CSR form together with the vocabulary
+    and per-term document frequencies. IDF and row norms are derived from the
+    document frequencies at query time, so adding or removing jobs never
+    requires re-fitting a vectorizer; weights match a TfidfVectorizer fitted
+    on the live jobs.
+    """
+    def __init__(self, path=INDEX_DIR):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.analyzer = TfidfVectorizer(stop_words="english").build_analyzer()
+
+        indptr_path = self._file("indptr")
+        if not os.path.exists(indptr_path):
+            np.array([0], dtype=np.int64).tofile(indptr_path)
+
+        vocabulary_path = os.path.join(path, "vocabulary.json")
+        if os.path.exists(vocabulary_path):
+            with open(vocabulary_path, "r", encoding="utf-8") as f:
+                self.terms = json.load(f)
+        else:
+            self.terms = []
+        self.vocabulary = {term: idx for idx, term in enumerate(self.terms)}
+
+        df_path = os.path.join(path, "df.npy")
+        self.df = np.load(df_path) if os.path.exists(df_path) else np.zeros(0, dtype=np.int64)
+
+        self.jobs = []
+        jobs_path = os.path.join(path, "jobs.jsonl")
+        if os.path.exists(jobs_path):
+            with open(jobs_path, "r", encoding="utf-8") as f:
+                self.jobs = [json.loads(line) for line in f if line.strip()]
+
+        self._arrays = None
+        self.rows_by_key = {}
+        alive = self._load()["alive"]
+        for row, job in enumerate(self.jobs):
+            if alive[row]:
+                self.rows_by_key[job_key(job)] = row
+
+    def _file(self, name):
+        return os.path.join(self.path, f"{name}.bin")
+
+    def _load(self):
+        """Memory-map the raw arrays, reusing the mapping until the next write."""
+        if self._arrays is None:
+            arrays = {}
+            for name, dtype in _ARRAYS.items():
+                filename = self._file(name)
+                if os.path.exists(filename) and os.path.getsize(filename):
+                    arrays[name] = np.memmap(filename, dtype=dtype, mode="r")
+                else:
+                    arrays[name] = np.zeros(0, dtype=dtype)
+            self._arrays = arrays
+        return self._arrays
+
+    def _save_metadata(self):
+        with open(os.path.join(self.path, "vocabulary.json"), "w", encoding="utf-8") as f:
+            json.dump(self.terms, f, ensure_ascii=False)
+        np.save(os.path.join(self.path, "df.npy"), self.df)
+
+    def __len__(self):
+        return len(self.rows_by_key)
+
+    def _term_counts(self, text, grow=False):
+        """Count the analyzer's terms in a text, optionally adding new terms to the vocabulary."""
+        counts = Counter(self.analyzer(text))
+        columns, values = [], []
+        for term, count in counts.items():
+            column = self.vocabulary.get(term)
+            if column is None:
+                if not grow:
+                    continue
+                column = len(self.terms)
+                self.vocabulary[term] = column
+                self.terms.append(term)
+            columns.append(column)
+            values.append(count)
+        return np.array(columns, dtype=np.int32), np.array(values, dtype=np.float32)
+
+    def _query_counts(self, text):
+        """Term counts of a query text, limited to terms that occur in a live job."""
+        columns, counts = self._term_counts(text)
+        # Terms of removed jobs stay in the vocabulary with df 0 until compact(); a vectorizer
+        # fitted on the live jobs would not know them, so they must not weigh on the query
+        live = self.df[columns] > 0
+        return columns[live], counts[live]
+
+    def add_jobs(self, jobs):
+        """
+        Append jobs to the index. Jobs already present are replaced.
+
+        Args:
+            jobs (list): Job records with at least a "description"
+
+        Returns:
+            int: Number of jobs written
+        """
+        jobs = list({job_key(job): job for job in jobs}.values())
+        if not jobs:
+            return 0
+
+        self.remove_jobs(job_key(job) for job in jobs)
+
+        arrays = self._load()
+        next_pointer = int(arrays["indptr"][-1])
+        first_row = len(self.jobs)
+        data, indices, rows, indptr = [], [], [], []
+
+        for offset, job in enumerate(jobs):
+            columns, values = self._term_counts(job.get("description", ""), grow=True)
+            data.append(values)
+            indices.append(columns)
+            rows.append(np.full(len(columns), first_row + offset, dtype=np.int32))
+            next_pointer += len(columns)
+            indptr.append(next_pointer)
+
+        new_indices = np.concatenate(indices)
+        self.df = np.concatenate([self.df, np.zeros(len(self.terms) - len(self.df), dtype=np.int64)])
+        np.add.at(self.df, new_indices, 1)
+
+        self._arrays = None
+        chunks = {
+            "data": np.concatenate(data),
+            "indices": new_indices,
+            "rows": np.concatenate(rows),
+            "indptr": np.array(indptr, dtype=np.int64),
+            "alive": np.ones(len(jobs), dtype=np.uint8),
+        }
+        for name, chunk in chunks.items():
+            with open(self._file(name), "ab") as f:
+                f.write(chunk.astype(_ARRAYS[name]).tobytes())
+
+        with open(os.path.join(self.path, "jobs.jsonl"), "a", encoding="utf-8") as f:
+            for offset, job in enumerate(jobs):
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+                self.jobs.append(job)
+                self.rows_by_key[job_key(job)] = first_row + offset
+
+        self._save_metadata()
+        return len(jobs)
+
+    def remove_jobs(self, keys):
+        """
+        Drop jobs from the index without rewriting the matrix.
+
+        Rows are tombstoned and their terms' document frequencies decremented;
+        compact() reclaims the space later.
+
+        Args:
+            keys (iterable): Keys as returned by search_plan.job_key
+
+        Returns:
+            int: Number of jobs removed
+        """
+        rows = [self.rows_by_key.pop(key) for key in set(keys) if key in self.rows_by_key]
+        if not rows:
+            return 0
+
+        arrays = self._load()
+        for row in rows:
+            start, end = arrays["indptr"][row], arrays["indptr"][row + 1]
+            np.subtract.at(self.df, arrays["indices"][start:end], 1)
+
+        self._arrays = None
+        alive = np.memmap(self._file("alive"), dtype=np.uint8, mode="r+")
+        alive[rows] = 0
+        alive.flush()
+        del alive
+
+        self._save_metadata()
+        return len(rows)
+
+    def remove_older_than(self, cutoff):
+        """
+        Drop jobs whose ISO "date_posted" is before the cutoff.
+
+        Jobs without a parseable date are kept.
+
+        Args:
+            cutoff (datetime.date): Oldest posting date to keep
+
+        Returns:
+            int: Number of jobs removed
+        """
+        expired = []
+        for key, row in self.rows_by_key.items():
+            try:
+                posted = date.fromisoformat(str(self.jobs[row].get("date_posted", ""))[:10])
+            except ValueError:
+                continue
+            if posted < cutoff:
+                expired.append(key)
+        return self.remove_jobs(expired)
+
+    def compact(self):
+        """Rewrite the index without removed jobs."""
+        live_jobs = [self.jobs[row] for row in sorted(self.rows_by_key.values())]
+        for name in list(_ARRAYS) + ["vocabulary.json", "df.npy", "jobs.jsonl"]:
+            filename = self._file(name) if name in _ARRAYS else os.path.join(self.path, name)
+            if os.path.exists(filename):
+                os.remove(filename)
+        self.__init__(self.path)
+        self.add_jobs(live_jobs)
+
+    def idf(self):
+        """Smoothed IDF of every term, as computed by TfidfVectorizer's defaults."""
+        return np.log((1 + len(self)) / (1 + self.df)) + 1
+
+    def tfidf_matrix(self):
+        """
+        The stored jobs as an L2-normalised sparse TF-IDF matrix.
+
+        Returns:
+            scipy.sparse.csr_matrix: One row per stored row; removed jobs are empty rows
+        """
+        arrays = self._load()
+        n_rows = len(arrays["indptr"]) - 1
+        alive = np.repeat(arrays["alive"], np.diff(arrays["indptr"]))
+        data = arrays["data"] * self.idf()[arrays["indices"]] * alive
+        matrix = sparse.csr_matrix((data, np.asarray(arrays["indices"]), np.asarray(arrays["indptr"])),
+                                   shape=(n_rows, len(self.terms)))
+        return normalize(matrix)
+
+    def query_tfidf(self, text):
+        """A text as an L2-normalised 1 x n_terms TF-IDF row in the index's term space."""
+        columns, counts = self._query_counts(text)
+        query = sparse.csr_matrix((counts * self.idf()[columns], (np.zeros(len(columns), dtype=np.int32), columns)),
+                                  shape=(1, len(self.terms)))
+        return normalize(query)
+
+    def scores(self, resume_text, rows=None):
+        """
+        Cosine similarity of indexed jobs to a resume.
+
+        Args:
+            resume_text (str): Plain text of the resume
+            rows (numpy.ndarray): Only score these rows, e.g. ANN candidates (default: all rows)
+
+        Returns:
+            numpy.ndarray: One score per row (per requested row); removed rows score 0
+        """
+        arrays = self._load()
+        if rows is None:
+            n_rows = len(arrays["indptr"]) - 1
+            positions = slice(None)
+            local_rows = arrays["rows"]
+            alive = arrays["alive"]
+        else:
+            rows = np.asarray(rows, dtype=np.int64)
+            n_rows = len(rows)
+            starts = arrays["indptr"][rows]
+            lengths = arrays["indptr"][rows + 1] - starts
+            # Positions of every stored count belonging to the requested rows
+            positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            local_rows = np.repeat(np.arange(n_rows), lengths)
+            alive = arrays["alive"][rows]
+
+        if not len(self) or not resume_text.strip():
+            return np.zeros(n_rows)
+
+        idf = self.idf()
+        columns, counts = self._query_counts(resume_text)
+        query = np.zeros(len(self.terms))
+        query[columns] = counts * idf[columns]
+        query_norm = np.linalg.norm(query)
+        if not query_norm:
+            return np.zeros(n_rows)
+
+        data, indices = arrays["data"][positions], arrays["indices"][positions]
+        dots = np.bincount(local_rows, weights=data * (idf * query)[indices], minlength=n_rows)
+        norms = np.sqrt(np.bincount(local_rows, weights=(data * idf[indices]) ** 2, minlength=n_rows))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(norms > 0, dots / (norms * query_norm), 0.0)
+        return scores * alive
+
+    def match(self, resume_text, top_k=10, candidates=None):
+        """
+        Rank indexed jobs against a resume.
+
+        Args:
+            resume_text (str): Plain text of the resume
+            top_k (int): Number of jobs to return
+            candidates (numpy.ndarray): Only rank these rows, e.g. from DenseJobIndex (default: all jobs)
+
+        Returns:
+            list: (job, similarity_score) pairs, best first
+        """
+        alive = self._load()["alive"]
+        if candidates is None:
+            rows = np.flatnonzero(alive)
+            scores = self.scores(resume_text)[rows]
+        else:
+            candidates = np.asarray(candidates, dtype=np.int64)
+            rows = np.unique(candidates[alive[candidates] > 0])
+            scores = self.scores(resume_text, rows)
+        best = top_k_indices(scores, top_k)
+        return [(self.jobs[rows[i]], float(scores[i])) for i in best]
+
+
+if __name__ == "__main__":
+    jobs_file = sys.argv[1] if len(sys.argv) > 1 else "linkedin_jobs.json"
+    if jobs_file.endswith(".jsonl"):
+        # The scraper's append-only job file (see job_store.JOBS_PATH)
+        from job_store import JobStore
+
+        scraped = list(JobStore(jobs_file))
+    else:
+        with open(jobs_file, "r", encoding="utf-8") as f:
+            scraped = json.load(f)
+    index = JobIndex()
+    index.add_jobs(scraped)
+    print(f"Indexed {len(scraped)} jobs from {jobs_file}; {len(index)} jobs in {index.path}")
@@ -0,0 +1,191 @@
+import os
+import sys
+import json
+import zlib
+import numpy as np
+
+# Short strings that repeat across postings are interned: each row holds an
+# int32 code into a per-column table of unique values.
+CATEGORICAL_FIELDS = ("title", "company", "location", "date_posted")
+# Free text is UTF-8 encoded into one bytearray per field; row i is
+# blob[offsets[i]:offsets[i + 1]].
+TEXT_FIELDS = ("description", "url", "job_id", "variants")
+# Descriptions dominate the footprint and are only decoded a page at a time
+# (or once when a matcher is fitted), so they are stored zlib-compressed.
+COMPRESSED_FIELDS = ("description",)
+# Lists (reposts collapsed into a job by dedup.py) are stored as JSON text;
+# an empty entry reads back as an empty list.
+JSON_FIELDS = ("variants",)
+FIELDS = CATEGORICAL_FIELDS + TEXT_FIELDS
+# Every scrape is appended here, one job per line
+JOBS_PATH = "linkedin_jobs.jsonl"
+
+
+class JobStore:
+    """
+    Columnar store of scraped jobs.
+
+    Holds one array per field instead of one dict per job, so the per-job
+    cost is a few integers plus the encoded (descriptions: compressed) text,
+    not a dict and a string object per field. Jobs can be appended at any time and persisted to a
+    JSONL file, where new jobs are appended rather than rewriting the file.
+
+    Args:
+        path (str): JSONL file to load from and flush to (optional)
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self._size = 0
+        self._capacity = 0
+        self._codes = {field: np.empty(0, dtype=np.int32) for field in CATEGORICAL_FIELDS}
+        self._values = {field: [] for field in CATEGORICAL_FIELDS}
+        self._lookup = {field: {} for field in CATEGORICAL_FIELDS}
+        self._blobs = {field: bytearray() for field in TEXT_FIELDS}
+        self._offsets = {field: np.zeros(1, dtype=np.int64) for field in TEXT_FIELDS}
+        self._flushed = 0
+
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.extend(json.loads(line) for line in f if line.strip())
+            self._flushed = self._size
+
+    @classmethod
+    def from_jobs(cls, jobs):
+        """Build an in-memory store from a list of job dicts."""
+        store = cls()
+        store.extend(jobs)
+        return store
+
+    def __len__(self):
+        return self._size
+
+    def _grow(self, needed):
+        capacity = max(16, self._capacity)
+        while capacity < needed:
+            capacity *= 2
+        # New arrays rather than in-place resizing, so views handed out earlier stay valid
+        for field in CATEGORICAL_FIELDS:
+            codes = np.empty(capacity, dtype=np.int32)
+            codes[:self._size] = self._codes[field][:self._size]
+            self._codes[field] = codes
+        for field in TEXT_FIELDS:
+            offsets = np.empty(capacity + 1, dtype=np.int64)
+            offsets[:self._size + 1] = self._offsets[field][:self._size + 1]
+            self._offsets[field] = offsets
+        self._capacity = capacity
+
+    def append(self, job):
+        """
+        Add one job.
+
+        Args:
+            job (dict): Scraped job; missing fields are stored as empty strings
+
+        Returns:
+            int: Row of the new job
+        """
+        row = self._size
+        if row >= self._capacity:
+            self._grow(row + 1)
+
+        for field in CATEGORICAL_FIELDS:
+            value = job.get(field) or ""
+            code = self._lookup[field].get(value)
+            if code is None:
+                code = self._lookup[field][value] = len(self._values[field])
+                self._values[field].append(value)
+            self._codes[field][row] = code
+        for field in TEXT_FIELDS:
+            blob = self._blobs[field]
+            value = job.get(field)
+            if field in JSON_FIELDS:
+                value = json.dumps(value, ensure_ascii=False) if value else ""
+            data = (value or "").encode("utf-8")
+            blob += zlib.compress(data, 1) if field in COMPRESSED_FIELDS else data
+            self._offsets[field][row + 1] = len(blob)
+
+        self._size += 1
+        return row
+
+    def extend(self, jobs):
+        """Add several jobs."""
+        for job in jobs:
+            self.append(job)
+
+    def codes(self, field):
+        """Codes of a categorical field, one per row (a view, not a copy)."""
+        return self._codes[field][:self._size]
+
+    def categories(self, field):
+        """Unique values of a categorical field, indexed by code."""
+        return self._values[field]
+
+    def value(self, field, row):
+        """One field of one job."""
+        if field in self._codes:
+            return self._values[field][self._codes[field][row]]
+        offsets = self._offsets[field]
+        data = self._blobs[field][offsets[row]:offsets[row + 1]]
+        if field in JSON_FIELDS:
+            return json.loads(data) if data else []
+        return (zlib.decompress(data) if field in COMPRESSED_FIELDS else data).decode("utf-8")
+
+    def descriptions(self):
+        """Description of every job, in row order."""
+        return (self.value("description", row) for row in range(self._size))
+
+    def __getitem__(self, row):
+        """One job as a dict, for rendering; the store itself keeps no dicts."""
+        if not 0 <= row < self._size:
+            raise IndexError(row)
+        return {field: self.value(field, row) for field in FIELDS}
+
+    def __iter__(self):
+        return (self[row] for row in range(self._size))
+
+    def to_dataframe(self, rows=None, fields=CATEGORICAL_FIELDS):
+        """
+        DataFrame view of categorical fields.
+
+        Columns are pandas Categoricals built directly from the stored codes
+        and unique values, so no per-row string objects are created.
+
+        Args:
+            rows (array-like): Rows to include, in this order (default: all)
+            fields (tuple): Categorical fields to include
+
+        Returns:
+            pandas.DataFrame: One row per selected job
+        """
+        import pandas as pd
+
+        columns = {}
+        for field in fields:
+            codes = self.codes(field) if rows is None else self.codes(field)[rows]
+            columns[field] = pd.Categorical.from_codes(codes, categories=pd.Index(self._values[field], dtype=object))
+        return pd.DataFrame(columns, copy=False)
+
+    def flush(self, path=None):
+        """
+        Append the jobs added since the last flush to a JSONL file.
+
+        Args:
+            path (str): File to write (default: the store's path)
+        """
+        path = path or self.path
+        if self._flushed == self._size:
+            return
+        with open(path, "a", encoding="utf-8") as f:
+            for row in range(self._flushed, self._size):
+                f.write(json.dumps(self[row], ensure_ascii=False) + "\n")
+        self._flushed = self._size
+
+    def nbytes(self):
+        """Approximate memory held by the store's arrays and text."""
+        total = 0
+        for field in CATEGORICAL_FIELDS:
+            total += self._codes[field].nbytes
+            total += sum(sys.getsizeof(value) for value in self._values[field])
+        for field in TEXT_FIELDS:
+            total += len(self._blobs[field]) + self._offsets[field].nbytes
+        return total
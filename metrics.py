@@ -0,0 +1,274 @@
+import os
+import json
+import time
+import bisect
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Upper bounds (seconds) of the histogram buckets, as in Prometheus client defaults
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Recent observations kept per histogram for percentiles
+RESERVOIR_SIZE = 1024
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+class Histogram:
+    """Bucketed latency histogram with a window of recent values for percentiles."""
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.bucket_counts = [0] * (len(BUCKETS) + 1)
+        self.recent = deque(maxlen=RESERVOIR_SIZE)
+
+    def observe(self, seconds):
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        self.bucket_counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.recent.append(seconds)
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "total": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": _percentile(self.recent, 50) if self.recent else 0.0,
+            "p95": _percentile(self.recent, 95) if self.recent else 0.0,
+            "max": self.max
+        }
+
+
+class JsonlSink:
+    """
+    Appends every observation and counter increment to a JSONL file.
+
+    Args:
+        path (str): Log file
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+class MetricsRegistry:
+    """
+    Process-wide counters and latency histograms, keyed by dotted names
+    such as "scrape.page_load" or "match.score". Thread-safe.
+    """
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+        self.sinks = []
+        self._lock = threading.Lock()
+
+    def add_sink(self, sink):
+        """Call sink(event_dict) for every observation and increment, e.g. a JsonlSink."""
+        self.sinks.append(sink)
+
+    def _emit(self, event):
+        for sink in self.sinks:
+            try:
+                sink(event)
+            except Exception as e:
+                print(f"Metrics sink failed: {e}")
+
+    def increment(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+        if self.sinks:
+            self._emit({"time": time.time(), "type": "counter", "name": name, "value": value})
+
+    def observe(self, name, seconds):
+        with self._lock:
+            self.histograms[name].observe(seconds)
+        if self.sinks:
+            self._emit({"time": time.time(), "type": "timer", "name": name, "seconds": seconds})
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: "counters" by name and "timers" (count, total, mean, p50, p95, max) by name
+        """
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "timers": {name: histogram.summary() for name, histogram in self.histograms.items()}
+            }
+
+    def prometheus_text(self):
+        """Counters and histograms in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, value in sorted(self.counters.items()):
+                metric = _prometheus_name(name) + "_total"
+                lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+            for name, histogram in sorted(self.histograms.items()):
+                metric = _prometheus_name(name) + "_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(BUCKETS + (float("inf"),), histogram.bucket_counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{metric}_bucket{{le="{le}"}} {cumulative}')
+                lines += [f"{metric}_sum {histogram.sum}", f"{metric}_count {histogram.count}"]
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_name(name):
+    return "gitrecquest_" + "".join(c if c.isalnum() else "_" for c in name)
+
+
+REGISTRY = MetricsRegistry()
+
+if os.environ.get("METRICS_JSONL"):
+    REGISTRY.add_sink(JsonlSink(os.environ["METRICS_JSONL"]))
+
+
+class TimingProfile:
+    """
+    Per-run record of how long each step took, e.g. one search.
+
+    Steps are timed with the step() context manager; the report shows which
+    step dominates a run. Every duration is also observed in the process-wide
+    registry under prefix + step name. Safe to share between worker threads.
+
+    Args:
+        prefix (str): Prepended to step names in the registry, e.g. "scrape."
+        registry (MetricsRegistry): Where durations are also recorded (default: REGISTRY)
+    """
+    def __init__(self, prefix="", registry=None):
+        self.prefix = prefix
+        self.registry = registry or REGISTRY
+        self.durations = defaultdict(list)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def step(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.durations[name].append(seconds)
+        self.registry.observe(self.prefix + name, seconds)
+
+    def summary(self):
+        """
+        Returns:
+            dict: Per step, the count, total, mean, p95 and max duration in seconds
+        """
+        with self._lock:
+            return {
+                name: {
+                    "count": len(values),
+                    "total": sum(values),
+                    "mean": sum(values) / len(values),
+                    "p95": _percentile(values, 95),
+                    "max": max(values)
+                }
+                for name, values in self.durations.items()
+            }
+
+    def report(self):
+        """Format the summary as a table, slowest step first."""
+        rows = sorted(self.summary().items(), key=lambda item: item[1]["total"], reverse=True)
+        lines = [f"{'step':<22}{'count':>7}{'total s':>10}{'mean s':>10}{'p95 s':>10}{'max s':>10}"]
+        for name, stats in rows:
+            lines.append(f"{name:<22}{stats['count']:>7}{stats['total']:>10.2f}{stats['mean']:>10.2f}"
+                         f"{stats['p95']:>10.2f}{stats['max']:>10.2f}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def timer(name, profile=None):
+    """
+    Time a block into the registry histogram `name`, and into a TimingProfile if given.
+
+        with timer("match.score", profile):
+            scores = matcher.scores(resume_text)
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        if profile is not None:
+            profile.record(name, seconds)
+        else:
+            REGISTRY.observe(name, seconds)
+
+
+def timed(name):
+    """Decorator form of timer(name)."""
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with timer(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def increment(name, value=1):
+    """Add to the registry counter `name`."""
+    REGISTRY.increment(name, value)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+def serve_prometheus(port=None, registry=None):
+    """
+    Serve the registry as Prometheus text on http://127.0.0.1:<port>/metrics
+    from a background thread. Only the first call starts a server.
+
+    Args:
+        port (int): Port to listen on (default: $METRICS_PORT or 9464)
+        registry (MetricsRegistry): Registry to expose (default: REGISTRY)
+
+    Returns:
+        ThreadingHTTPServer: The running server
+    """
+    global _server
+    registry = registry or REGISTRY
+    with _server_lock:
+        if _server is not None:
+            return _server
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip("/") not in ("", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        port = port or int(os.environ.get("METRICS_PORT", 9464))
+        _server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, daemon=True).start()
+        return _server
@@ -0,0 +1,143 @@
+import os
+import sys
+import json
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from sklearn.feature_extraction.text import TfidfVectorizer
+from resume_ingest import FILE_TYPES, extract_text_from_path
+from resume_matcher import SKILL_EXTRACTOR, top_k_indices
+
+
+def list_resume_files(directory):
+    """
+    Find resume files (PDF, DOCX, TXT) under a directory.
+
+    Returns:
+        list: File paths, sorted for a stable ranking order
+    """
+    paths = []
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if os.path.splitext(filename)[1].lower() in FILE_TYPES:
+                paths.append(os.path.join(root, filename))
+    return sorted(paths)
+
+
+def _extract(path):
+    """Extract one resume in a worker process; failures are reported, not raised."""
+    try:
+        return extract_text_from_path(path), None
+    except Exception as e:
+        return "", f"{type(e).__name__}: {e}"
+
+
+def extract_resumes(paths, workers=None):
+    """
+    Extract resume texts in a process pool.
+
+    Args:
+        paths (list): Resume file paths
+        workers (int): Worker processes (default: one per CPU)
+
+    Returns:
+        list: (text, error) per path, in the same order
+    """
+    if not paths:
+        return []
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_extract, paths, chunksize=chunksize))
+
+
+def rank_resumes(job_description, directory, top_k=10, workers=None, skill_extractor=None):
+    """
+    Rank every resume in a directory against one job description.
+
+    All resumes are vectorized into one sparse matrix with a TF-IDF model
+    fitted on the resumes themselves, and scored against the job with a
+    single sparse matrix-vector product. Skills are only compared for the
+    returned top-k.
+
+    Args:
+        job_description (str): Text of the job posting
+        directory (str): Directory searched recursively for PDF, DOCX and TXT files
+        top_k (int): Number of resumes to return
+        workers (int): Processes used for text extraction (default: one per CPU)
+        skill_extractor (SkillExtractor): Skill taxonomy (default: SKILL_SET)
+
+    Returns:
+        list: Result dicts with path, similarity_score, matched_skills and
+            missing_skills, best first
+    """
+    skill_extractor = skill_extractor or SKILL_EXTRACTOR
+    paths = list_resume_files(directory)
+    extracted = extract_resumes(paths, workers)
+
+    # Unreadable or empty resumes are left out of the model and the ranking
+    ranked_paths, texts = [], []
+    for path, (text, error) in zip(paths, extracted):
+        if error:
+            print(f"Skipping {path}: {error}", file=sys.stderr)
+        elif not text.strip():
+            print(f"Skipping {path}: no text extracted", file=sys.stderr)
+        else:
+            ranked_paths.append(path)
+            texts.append(text)
+    paths = ranked_paths
+    if not texts:
+        return []
+
+    vectorizer = TfidfVectorizer(stop_words="english")
+    resume_tfidf = vectorizer.fit_transform(texts)
+    job_tfidf = vectorizer.transform([job_description])
+    scores = (resume_tfidf @ job_tfidf.T).toarray().ravel()
+
+    top = top_k_indices(scores, top_k)
+
+    job_skills = skill_extractor.extract(job_description)
+    results = []
+    for idx in top:
+        resume_skills = skill_extractor.extract(texts[idx])
+        results.append({
+            "path": paths[idx],
+            "similarity_score": float(scores[idx]),
+            "matched_skills": sorted(job_skills & resume_skills),
+            "missing_skills": sorted(job_skills - resume_skills)
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank a folder of resumes against one job description.")
+    parser.add_argument("directory", help="directory of PDF, DOCX and TXT resumes")
+    job = parser.add_mutually_exclusive_group(required=True)
+    job.add_argument("--job-file", help="file containing the job description")
+    job.add_argument("--job-text", help="job description text")
+    parser.add_argument("--top-k", type=int, default=10, help="number of resumes to show (default: 10)")
+    parser.add_argument("--workers", type=int, default=None, help="extraction processes (default: one per CPU)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    if args.job_file:
+        with open(args.job_file, "r", encoding="utf-8") as f:
+            job_description = f.read()
+    else:
+        job_description = args.job_text
+
+    results = rank_resumes(job_description, args.directory, args.top_k, args.workers)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for rank, result in enumerate(results, start=1):
+        print(f"{rank:>3}. {result['similarity_score']:6.1%}  {result['path']}")
+        if result["matched_skills"]:
+            print(f"       matched: {', '.join(result['matched_skills'])}")
+        if result["missing_skills"]:
+            print(f"       missing: {', '.join(result['missing_skills'])}")
+
+
+if __name__ == "__main__":
+    main()
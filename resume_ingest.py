@@ -0,0 +1,123 @@
+import io
+import os
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from metrics import increment, timer
+
+PDF_TYPE = "application/pdf"
+DOCX_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TEXT_TYPE = "text/plain"
+
+FILE_TYPES = {".pdf": PDF_TYPE, ".docx": DOCX_TYPE, ".txt": TEXT_TYPE}
+
+MAX_BYTES = 10 * 1024 * 1024
+MAX_PAGES = 50
+TIME_LIMIT = 10.0
+CACHE_SIZE = 128
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class ResumeLimitError(ValueError):
+    """Raised when an uploaded resume exceeds the size, page or time limits."""
+
+
+def file_type_for_path(path):
+    """MIME type for a resume file path, based on its extension (plain text if unknown)."""
+    return FILE_TYPES.get(os.path.splitext(path)[1].lower(), TEXT_TYPE)
+
+
+def extract_pdf_text(data, max_pages=MAX_PAGES, time_limit=TIME_LIMIT):
+    """
+    Extract the text of a PDF page by page.
+
+    Args:
+        data (bytes): PDF file contents
+        max_pages (int): Largest page count accepted
+        time_limit (float): Seconds allowed for the whole extraction
+
+    Returns:
+        str: Text of all pages, joined once at the end
+    """
+    import PyPDF2
+
+    deadline = time.monotonic() + time_limit
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+
+    page_count = len(pdf_reader.pages)
+    if page_count > max_pages:
+        raise ResumeLimitError(f"PDF has {page_count} pages; at most {max_pages} are accepted")
+
+    pages = []
+    for page in pdf_reader.pages:
+        # Checked between pages: a single pathological page still runs to completion
+        if time.monotonic() > deadline:
+            raise ResumeLimitError(f"PDF text extraction took longer than {time_limit:.0f} seconds")
+        pages.append(page.extract_text() or "")
+    return "\n".join(pages)
+
+
+def extract_resume_text(data, file_type, max_bytes=MAX_BYTES, max_pages=MAX_PAGES, time_limit=TIME_LIMIT):
+    """
+    Extract text from resume file contents (PDF, DOCX or TXT), cached by content hash.
+
+    Re-extracting the same bytes, e.g. on every Streamlit rerun, returns the
+    cached text without parsing the file again.
+
+    Args:
+        data (bytes): File contents
+        file_type (str): MIME type of the file
+        max_bytes (int): Largest file size accepted
+        max_pages (int): Largest PDF page count accepted
+        time_limit (float): Seconds allowed for PDF extraction
+
+    Returns:
+        str: Extracted text
+    """
+    if len(data) > max_bytes:
+        raise ResumeLimitError(f"File is {len(data) / 1024 / 1024:.1f} MB; at most {max_bytes / 1024 / 1024:.0f} MB is accepted")
+
+    key = (hashlib.sha256(data).hexdigest(), file_type)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            increment("resume.cache_hits")
+            return _cache[key]
+
+    with timer("resume.extract"):
+        if file_type == PDF_TYPE:
+            text = extract_pdf_text(data, max_pages, time_limit)
+        elif file_type == DOCX_TYPE:
+            import docx2txt
+            text = docx2txt.process(io.BytesIO(data))
+        else:
+            text = data.decode("utf-8")
+
+    with _cache_lock:
+        _cache[key] = text
+        if len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return text
+
+
+def extract_text_from_path(path, **limits):
+    """
+    Extract text from a resume file on disk.
+
+    Args:
+        path (str): Path of a PDF, DOCX or TXT file
+        **limits: max_bytes, max_pages or time_limit overrides
+
+    Returns:
+        str: Extracted text
+    """
+    max_bytes = limits.get("max_bytes", MAX_BYTES)
+    if os.path.getsize(path) > max_bytes:
+        raise ResumeLimitError(f"{path} is larger than {max_bytes / 1024 / 1024:.0f} MB")
+
+    with open(path, "rb") as f:
+        data = f.read()
+    return extract_resume_text(data, file_type_for_path(path), **limits)
@@ -1,6 +1,7 @@
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
+from skill_extractor import SkillExtractor
+from metrics import timer
 
 
 SKILL_SET = [
@@ -14,21 +15,65 @@ SKILL_SET = [
     "Manufacturing", "Sales", "Management"
 ]
 
+# Compiled once at import; pass a SkillExtractor.from_file(...) to the matchers
+# to use a larger taxonomy instead.
+SKILL_EXTRACTOR = SkillExtractor(SKILL_SET)
+
+def _tfidf_vectorizer():
+    # scikit-learn is imported on first use, not when the app starts (see warmup.py)
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    return TfidfVectorizer(stop_words="english")
+
+
+def top_k_indices(scores, k=10, offset=0):
+    """
+    Indices of the best-scoring rows, in rank order, without sorting every score.
+
+    numpy.argpartition selects the first offset + k ranks in linear time and
+    only those are sorted, so fetching a page costs O(n + page end), not
+    O(n log n).
+
+    Args:
+        scores (numpy.ndarray): One score per row
+        k (int): Number of indices to return (a page size)
+        offset (int): Rank of the first index returned, e.g. page * k
+
+    Returns:
+        numpy.ndarray: Row indices for ranks offset .. offset + k - 1
+    """
+    scores = np.asarray(scores)
+    end = min(offset + k, len(scores))
+    if end <= offset:
+        return np.empty(0, dtype=np.intp)
+    if end < len(scores):
+        # Everything above the end-th best score, plus the earliest rows tied with it,
+        # so ties keep their original order exactly as a stable full sort would
+        threshold = -np.partition(-scores, end - 1)[end - 1]
+        above = np.flatnonzero(scores > threshold)
+        best = np.concatenate([above, np.flatnonzero(scores == threshold)[:end - len(above)]])
+    else:
+        best = np.arange(len(scores))
+    best = best[np.lexsort((best, -scores[best]))]
+    return best[offset:end]
+
+
 class ResumeMatcher:
-    def __init__(self, job_description):
+    def __init__(self, job_description, skill_extractor=None):
         self.job_description = job_description
-        self.vectorizer = TfidfVectorizer(stop_words="english")
+        self.skill_extractor = skill_extractor or SKILL_EXTRACTOR
+        self.vectorizer = _tfidf_vectorizer()
         self.job_tfidf = self.vectorizer.fit_transform([job_description])
     
     def match_resume(self, resume_text):
         if not resume_text.strip():
             return {"similarity_score": 0.0, "missing_skills": [], "matched_skills": []}
         
+        from sklearn.metrics.pairwise import cosine_similarity
         resume_tfidf = self.vectorizer.transform([resume_text])
         similarity = cosine_similarity(self.job_tfidf, resume_tfidf)[0][0]
         
-        job_skills = self.extract_skills(self.job_description)
-        resume_skills = self.extract_skills(resume_text)
+        job_skills = self.skill_extractor.extract_cached(self.job_description)
+        resume_skills = self.skill_extractor.extract(resume_text)
         
         missing_skills = job_skills - resume_skills
         matched_skills = job_skills.intersection(resume_skills)
@@ -41,5 +86,98 @@ class ResumeMatcher:
     
     @staticmethod
     def extract_skills(text):
-        text = text.lower()
-        return {skill.lower() for skill in SKILL_SET if skill.lower() in text}
\ No newline at end of file
+        return SKILL_EXTRACTOR.extract(text)
+
+class BatchResumeMatcher:
+    """
+    Score one resume against many job descriptions with a single TF-IDF model.
+
+    The vectorizer is fitted once over every job description, so IDF reflects
+    the whole result set, and all similarities come from one sparse
+    matrix-vector product instead of one fit per listing.
+    """
+    def __init__(self, job_descriptions, skill_extractor=None):
+        self.job_descriptions = list(job_descriptions)
+        self.skill_extractor = skill_extractor or SKILL_EXTRACTOR
+        self.vectorizer = _tfidf_vectorizer()
+        self.job_tfidf = None
+        with timer("match.vectorize"):
+            try:
+                self.job_tfidf = self.vectorizer.fit_transform(self.job_descriptions)
+            except ValueError:
+                # No jobs, or only empty and stop-word descriptions: nothing to score against
+                pass
+        with timer("match.job_skills"):
+            self.job_skills = [self.skill_extractor.extract_cached(description) for description in self.job_descriptions]
+
+    def scores(self, resume_text):
+        """
+        Compute the cosine similarity of every job description to the resume.
+
+        Args:
+            resume_text (str): Plain text of the resume
+
+        Returns:
+            numpy.ndarray: One similarity score per job description
+        """
+        if self.job_tfidf is None or not resume_text.strip():
+            return np.zeros(len(self.job_descriptions))
+
+        with timer("match.score"):
+            resume_tfidf = self.vectorizer.transform([resume_text])
+            # Rows are L2-normalised by the vectorizer, so the dot product is the cosine.
+            return (self.job_tfidf @ resume_tfidf.T).toarray().ravel()
+
+    def match_rows(self, resume_text, rows, similarities=None):
+        """
+        Match a resume against selected job descriptions only, e.g. one page of results.
+
+        Args:
+            resume_text (str): Plain text of the resume
+            rows (iterable): Indices of the job descriptions to match
+            similarities (numpy.ndarray): Scores from scores(), reused instead of recomputed
+
+        Returns:
+            list: One result dict per row, in the same shape as ResumeMatcher.match_resume
+        """
+        rows = list(rows)
+        if similarities is None:
+            similarities = self.scores(resume_text)
+        if not resume_text.strip():
+            return [{"similarity_score": 0.0, "missing_skills": [], "matched_skills": []} for _ in rows]
+        resume_skills = self.skill_extractor.extract_cached(resume_text)
+
+        return [
+            {
+                "similarity_score": float(similarities[row]),
+                "missing_skills": list(self.job_skills[row] - resume_skills),
+                "matched_skills": list(self.job_skills[row] & resume_skills)
+            }
+            for row in rows
+        ]
+
+    def match_resume(self, resume_text):
+        """
+        Match a resume against every job description.
+
+        Args:
+            resume_text (str): Plain text of the resume
+
+        Returns:
+            list: One result dict per job, in the same shape as ResumeMatcher.match_resume
+        """
+        if not resume_text.strip():
+            return [{"similarity_score": 0.0, "missing_skills": [], "matched_skills": []}
+                    for _ in self.job_descriptions]
+
+        similarities = self.scores(resume_text)
+        resume_skills = self.skill_extractor.extract(resume_text)
+
+        return [
+            {
+                "similarity_score": float(similarity),
+                "missing_skills": list(job_skills - resume_skills),
+                "matched_skills": list(job_skills & resume_skills)
+            }
+            for similarity, job_skills in zip(similarities, self.job_skills)
+        ]
\ No newline at end of file
@@ -0,0 +1,168 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from metrics import increment
+
+# Also holds description_store's table, so both stay in one file
+CACHE_PATH = "scrape_cache.sqlite3"
+
+
+@contextmanager
+def connect(path=CACHE_PATH):
+    """Open the SQLite file for one transaction, committed on success, and close it."""
+    db = sqlite3.connect(path, timeout=30)
+    try:
+        with db:
+            yield db
+    finally:
+        db.close()
+
+
+class ScrapeCache:
+    """
+    On-disk cache of scrape results keyed by the search parameters.
+
+    Entries expire after `ttl` seconds and the least recently used entries
+    are evicted once more than `max_entries` are stored. Hit and miss counts
+    are kept for the lifetime of the object (see stats()) and reported to the
+    metrics registry as scrape_cache.hits and scrape_cache.misses.
+
+    Args:
+        path (str): SQLite database file
+        ttl (float): Seconds an entry stays fresh
+        max_entries (int): Maximum number of stored searches
+    """
+    def __init__(self, path=CACHE_PATH, ttl=3600, max_entries=256):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS searches ("
+                "key TEXT PRIMARY KEY, params TEXT, job_listings TEXT, "
+                "fetched_at REAL, last_access REAL)"
+            )
+
+    def _connect(self):
+        return connect(self.path)
+
+    @staticmethod
+    def make_key(params):
+        """Hash search parameters into a cache key; keyword and location case and spacing are ignored."""
+        params = dict(params)
+        for field in ("keyword", "location"):
+            if isinstance(params.get(field), str):
+                params[field] = " ".join(params[field].lower().split())
+            elif isinstance(params.get(field), list):
+                # A search plan returns the same postings whatever order its terms are given in
+                params[field] = sorted(" ".join(term.lower().split()) for term in params[field])
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def lookup(self, **params):
+        """
+        Fetch a fresh entry for the given search parameters.
+
+        Returns:
+            dict: "job_listings" and "fetched_at" (epoch seconds), or None on a miss
+        """
+        key = self.make_key(params)
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT job_listings, fetched_at FROM searches WHERE key = ? AND fetched_at >= ?",
+                (key, now - self.ttl)
+            ).fetchone()
+            if row:
+                db.execute("UPDATE searches SET last_access = ? WHERE key = ?", (now, key))
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        # Also counted process-wide, for the debug panel, the JSONL log and Prometheus
+        increment("scrape_cache.hits" if row else "scrape_cache.misses")
+
+        if not row:
+            return None
+        return {"job_listings": json.loads(row[0]), "fetched_at": row[1]}
+
+    def get(self, **params):
+        """Cached job listings for the given search parameters, or None."""
+        entry = self.lookup(**params)
+        return entry["job_listings"] if entry else None
+
+    def put(self, job_listings, **params):
+        """Store the results of a search, evicting expired and least recently used entries."""
+        now = time.time()
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?)",
+                (self.make_key(params), json.dumps(params, sort_keys=True),
+                 json.dumps(job_listings, ensure_ascii=False), now, now)
+            )
+            db.execute("DELETE FROM searches WHERE fetched_at < ?", (now - self.ttl,))
+            db.execute(
+                "DELETE FROM searches WHERE key NOT IN "
+                "(SELECT key FROM searches ORDER BY last_access DESC LIMIT ?)",
+                (self.max_entries,)
+            )
+
+    def invalidate(self, **params):
+        """Drop the entry for the given search parameters."""
+        with self._connect() as db:
+            db.execute("DELETE FROM searches WHERE key = ?", (self.make_key(params),))
+
+    def clear(self):
+        with self._connect() as db:
+            db.execute("DELETE FROM searches")
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits, misses and number of stored entries
+        """
+        with self._connect() as db:
+            entries = db.execute("SELECT COUNT(*) FROM searches").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_scrape_cache():
+    """The process-wide ScrapeCache used unless one is passed in."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ScrapeCache()
+        return _default_cache
+
+def search_params(keyword, n=5, location=None, experience_levels=None, job_types=None):
+    """
+    The parameters that determine a search's results, as used for the cache key.
+
+    keyword and location may be lists, for a search plan over several of each
+    (see search_plan.py); a single-item list is the same as a plain string.
+    The experience level and job type filters are sorted, so their order
+    does not change the key.
+    """
+    return {
+        "keyword": _single_or_list(keyword),
+        "location": _single_or_list(location) or None,
+        "n": n,
+        "experience_levels": sorted(experience_levels) if experience_levels else None,
+        "job_types": sorted(job_types) if job_types else None
+    }
+
+def _single_or_list(value):
+    if isinstance(value, (list, tuple)):
+        value = [item for item in value if item]
+        return value[0] if len(value) == 1 else (value or None)
+    return value
@@ -0,0 +1,167 @@
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from scrape_cache import ScrapeCache, get_scrape_cache, search_params
+from search_plan import iter_search
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class ScrapeJob:
+    """
+    One background search and its progress.
+
+    Args:
+        key (str): Cache key of the search parameters; also the job's ID
+        params (dict): Search parameters from search_params
+    """
+    def __init__(self, key, params):
+        self.key = key
+        self.params = params
+        self.state = QUEUED
+        self.job_listings = []
+        self.error = None
+        self.cached_at = None
+        self.profile = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+
+    def status(self):
+        """
+        Snapshot of the job for the UI.
+
+        Returns:
+            dict: key, state, found (jobs so far), requested (n), error,
+                job_listings (partial until the state is done), cached_at
+                (fetch time when served from the scrape cache), timings (per-step
+                summary of the job's TimingProfile) and elapsed seconds
+        """
+        end = self.finished_at or time.time()
+        return {
+            "key": self.key,
+            "state": self.state,
+            "found": len(self.job_listings),
+            "requested": self.params["n"],
+            "error": self.error,
+            "cached_at": self.cached_at,
+            "job_listings": list(self.job_listings),
+            "timings": self.profile.summary() if self.profile else {},
+            "elapsed": end - self.submitted_at
+        }
+
+
+class ScrapeQueue:
+    """
+    Runs scrapes on background threads so the Streamlit script never blocks.
+
+    Searches are queued on a small thread pool; every worker borrows its
+    browsers from the shared BrowserPool, so concurrent users share a bounded
+    set of Chrome sessions. Identical searches (same cache key) that are
+    queued or running are merged into one job, and searches already in the
+    scrape cache complete immediately. Finished results are written to the
+    scrape cache, where every session picks them up.
+
+    Args:
+        workers (int): Scrapes run concurrently
+        cache (ScrapeCache): Where results land (default: the shared cache)
+        keep_finished (float): Seconds a finished job's status stays available
+        **scraper_kwargs: Passed through to iter_search, e.g. workers or pool
+    """
+    def __init__(self, workers=2, cache=None, keep_finished=600, **scraper_kwargs):
+        self.cache = cache or get_scrape_cache()
+        self.keep_finished = keep_finished
+        self.scraper_kwargs = scraper_kwargs
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scrape")
+        self._jobs = {}
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+
+    def submit(self, keyword, n=5, location=None, experience_levels=None, job_types=None):
+        """
+        Queue a search, or join the identical one already queued or running.
+
+        keyword and location may be lists: the search then runs as a search plan
+        over every keyword in every location (see search_plan.py), returning at
+        most n jobs in total. experience_levels and job_types are the UI's
+        filter labels (see scraper.build_search_url).
+
+        Returns:
+            str: Job key for status()
+        """
+        params = search_params(keyword, n, location, experience_levels, job_types)
+        key = ScrapeCache.make_key(params)
+
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(key)
+            if job and job.state in (QUEUED, RUNNING):
+                return key
+
+            job = self._jobs[key] = ScrapeJob(key, params)
+            cached = self.cache.lookup(**params)
+            if cached is not None:
+                job.job_listings = cached["job_listings"]
+                job.cached_at = cached["fetched_at"]
+                job.state = DONE
+                job.finished_at = time.time()
+                return key
+
+        self._executor.submit(self._run, job)
+        return key
+
+    def status(self, key):
+        """Status snapshot of a submitted job (see ScrapeJob.status), or None if unknown or pruned."""
+        with self._lock:
+            job = self._jobs.get(key)
+            return job.status() if job else None
+
+    def in_flight(self):
+        """Number of queued and running jobs."""
+        with self._lock:
+            return sum(job.state in (QUEUED, RUNNING) for job in self._jobs.values())
+
+    def _prune(self):
+        cutoff = time.time() - self.keep_finished
+        for key in [key for key, job in self._jobs.items() if job.finished_at and job.finished_at < cutoff]:
+            del self._jobs[key]
+
+    def _run(self, job):
+        job.state = RUNNING
+        try:
+            # Selenium is loaded by the first scrape, not when the app starts (see warmup.py)
+            from scraper import SCRAPE_PREFIX, TimingProfile, save_job_listings
+
+            job.profile = TimingProfile(SCRAPE_PREFIX)
+            # list.append is atomic, so status() can read partial results while this runs
+            for job_data in iter_search(**job.params, profile=job.profile, **self.scraper_kwargs):
+                job.job_listings.append(job_data)
+            if job.job_listings:
+                self.cache.put(job.job_listings, **job.params)
+                with self._save_lock:
+                    save_job_listings(job.job_listings)
+            job.state = DONE
+        except Exception as e:
+            print(f"Scrape for {job.params} failed: {e}")
+            job.error = f"{type(e).__name__}: {e}"
+            job.state = FAILED
+        finally:
+            job.finished_at = time.time()
+
+    def close(self):
+        """Stop accepting jobs and wait for running ones."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+_default_queue = None
+_default_queue_lock = threading.Lock()
+
+def get_scrape_queue():
+    """The process-wide ScrapeQueue shared by every Streamlit session."""
+    global _default_queue
+    with _default_queue_lock:
+        if _default_queue is None:
+            _default_queue = ScrapeQueue()
+        return _default_queue
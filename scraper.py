@@ -1,29 +1,73 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+import os
 import time
 import re
-import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from urllib.parse import quote, urlencode
+from browser_pool import get_browser_pool
+from description_store import get_description_store
+from html_to_text import html_to_text
+from job_store import JOBS_PATH, JobStore
+from metrics import TimingProfile, increment
 
-def setup_browser():
-    options = Options()
-    #add a piece of code to run this program without opening the browser
-    options.add_argument("--headless")  # Adding headless mode
-    options.add_argument("--disable-gpu")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--window-size=1920,1080")
+DESCRIPTION_SELECTOR = "div.show-more-less-html__markup"
+SHOW_MORE_SELECTOR = "button.show-more-less-html__button--more, button.show-more-less-html__button"
+LOAD_MORE_SELECTOR = "button.infinite-scroller__show-more-button"
+# Overridable so the scraper can run against a local fixture server (see benchmarks/bench_scraper.py)
+BASE_URL = os.environ.get("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+SEARCH_URL = f"{BASE_URL}/jobs/search"
+WAIT_TIMEOUT = 10
+# Registry prefix of the scraper's steps, e.g. "scrape.page_load"
+SCRAPE_PREFIX = "scrape."
+# LinkedIn search filters: experience level (f_E) and job type (f_JT) codes by the labels the UI shows
+EXPERIENCE_LEVEL_CODES = {"Internship": "1", "Entry level": "2", "Associate": "3", "Mid-Senior level": "4",
+                          "Director": "5", "Executive": "6"}
+JOB_TYPE_CODES = {"Full-time": "F", "Part-time": "P", "Contract": "C", "Temporary": "T", "Internship": "I"}
+# Title words of postings that LinkedIn's experience filter still lets through. Only unambiguous
+# ones: "lead", "staff" and "head" also name junior roles ("Team Lead", "Staff Accountant")
+SENIOR_TITLE_PATTERN = re.compile(r"\b(?:senior|sr|principal|director|vp|vice president|chief)\b", re.IGNORECASE)
+INTERN_TITLE_PATTERN = re.compile(r"\b(?:intern|internship)\b", re.IGNORECASE)
+JUNIOR_LEVELS = {"Internship", "Entry level", "Associate"}
 
-    # Fix: Use Service object with ChromeDriverManager
-    service = Service(ChromeDriverManager().install())
-    browser = webdriver.Chrome(service=service, options=options)
-    return browser
+def _description_snapshot(browser):
+    """The description container currently on the page and its text, if any."""
+    containers = browser.find_elements(By.CSS_SELECTOR, DESCRIPTION_SELECTOR)
+    if not containers:
+        return None, None
+    try:
+        return containers[0], containers[0].get_attribute("textContent")
+    except StaleElementReferenceException:
+        return None, None
+
+def _description_changed(previous_container, previous_text):
+    """Wait condition: a description container other than the given one is shown."""
+    def condition(browser):
+        container, text = _description_snapshot(browser)
+        if container is None:
+            return False
+        if container != previous_container or (text and text != previous_text):
+            return container
+        return False
+    return condition
 
-def close_modal_if_present(browser):
+def _button_expanded(button):
+    """Wait condition: a "Show More" button reports aria-expanded="true"."""
+    def condition(_):
+        try:
+            return button.get_attribute("aria-expanded") == "true"
+        except StaleElementReferenceException:
+            # The button was re-rendered, which only happens once the text expands
+            return True
+    return condition
+
+def close_modal_if_present(browser, profile=None):
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
     try:
         #add the class of the button to close the popup inside the find_elements()
         dismiss_buttons = browser.find_elements(
@@ -33,158 +77,569 @@ def close_modal_if_present(browser):
         
         for button in dismiss_buttons:
             if button.is_displayed():
-                browser.execute_script("arguments[0].click();", button)
-                print("Clicked modal dismiss button")
-                time.sleep(1)
+                with profile.step("modal_dismiss"):
+                    browser.execute_script("arguments[0].click();", button)
+                    print("Clicked modal dismiss button")
+                    WebDriverWait(browser, WAIT_TIMEOUT).until(EC.invisibility_of_element(button))
     except Exception as e:
+        increment("scrape.errors.modal")
         print("No modal found or error handling modal")
 
-def extract_job_description(browser, card):
+class RateLimiter:
+    """
+    Thread-safe limiter spacing page requests evenly across all workers.
+
+    Args:
+        requests_per_second (float): Global request budget; None disables limiting
+    """
+    def __init__(self, requests_per_second=None):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def read_job_card(card):
+    """
+    Read the summary fields shown on a search result card, without opening it.
+
+    Args:
+        card: WebElement of a "base-card"
+
+    Returns:
+        dict: job_id, title, company, location, date_posted and the job's url
+    """
+    job_data = {
+        "title": card.find_element(By.CLASS_NAME, "base-search-card__title").text.strip(),
+        "company": card.find_element(By.CLASS_NAME, "base-search-card__subtitle").find_element(By.TAG_NAME, "a").text.strip()
+    }
+
+    # Extract location if available
+    try:
+        job_data["location"] = card.find_element(By.CLASS_NAME, "job-search-card__location").text.strip()
+    except:
+        job_data["location"] = "Location not specified"
+
+    # Extract date posted if available
+    try:
+        job_data["date_posted"] = card.find_element(By.CSS_SELECTOR, "time.job-search-card__listdate").get_attribute("datetime")
+    except:
+        job_data["date_posted"] = "Recently posted"
+
+    # Link to the job page, used by parallel workers to open the posting directly
+    try:
+        job_data["url"] = card.find_element(By.CSS_SELECTOR, "a.base-card__full-link").get_attribute("href")
+    except:
+        job_data["url"] = None
+
+    job_data["job_id"] = read_job_id(card, job_data["url"])
+
+    return job_data
+
+def read_job_id(card, url=None):
+    """
+    Read the stable LinkedIn job ID of a card, e.g. "3812345678".
+
+    Uses the card's "urn:li:jobPosting:<id>" URN and falls back to the
+    trailing number of the job link.
+
+    Returns:
+        str: The job ID, or None if the card carries neither
+    """
+    try:
+        urn = card.get_attribute("data-entity-urn") or ""
+    except Exception:
+        urn = ""
+    match = re.search(r"jobPosting:(\d+)", urn) or re.search(r"-(\d+)(?:[/?]|$)", url or "")
+    return match.group(1) if match else None
+
+def extract_job_description(browser, card, profile=None):
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    try:
+        previous_container, previous_text = _description_snapshot(browser)
+        with profile.step("card_click"):
+            browser.execute_script("arguments[0].click();", card)
+            WebDriverWait(browser, WAIT_TIMEOUT, ignored_exceptions=(StaleElementReferenceException,)).until(
+                _description_changed(previous_container, previous_text)
+            )
+        return read_job_description(browser, profile)
+
+    except Exception as e:
+        increment("scrape.errors.card_click")
+        print(f"Error extracting job description: {e}")
+        return "No Description Found"
+
+def extract_job_description_from_url(browser, url, profile=None):
+    """
+    Open a job posting page and extract its description.
+
+    Args:
+        browser: WebDriver instance
+        url (str): Job posting url as read by read_job_card
+        profile (TimingProfile): Records the time spent in each step
+
+    Returns:
+        str: Cleaned job description
+    """
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    try:
+        with profile.step("job_page_load"):
+            browser.get(url)
+        close_modal_if_present(browser, profile)
+        return read_job_description(browser, profile)
+
+    except Exception as e:
+        increment("scrape.errors.job_page")
+        print(f"Error extracting job description from {url}: {e}")
+        return "No Description Found"
+
+def read_job_description(browser, profile=None):
+    """Expand and extract the job description currently shown in the browser."""
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
     try:
-        browser.execute_script("arguments[0].click();", card)
-        time.sleep(2)
         #add the class of the job description container inside the presence_of_element_located(())
         
-        description_container = WebDriverWait(browser, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "div.show-more-less-html__markup"))
-        )
-
-        js_remove_restrictions = """
-        var element = arguments[0];
-        element.className = '';
-        element.style.maxHeight = 'none';
-        element.style.overflow = 'visible';
-        return element.innerHTML;
-        """
+        with profile.step("description_wait"):
+            description_container = WebDriverWait(browser, WAIT_TIMEOUT).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, DESCRIPTION_SELECTOR))
+            )
 
         try:
             #add the class of the show more button inside the find_elements()
            
-            show_more_buttons = browser.find_elements(
-                By.CSS_SELECTOR, 
-                "button.show-more-less-html__button--more, button.show-more-less-html__button"
-            )
+            show_more_buttons = browser.find_elements(By.CSS_SELECTOR, SHOW_MORE_SELECTOR)
 
-            
             for button in show_more_buttons:
                 if button.is_displayed() and button.get_attribute("aria-expanded") == "false":
-                    browser.execute_script("arguments[0].click();", button)
-                    print("Clicked 'Show More' button")
-                    time.sleep(2)
+                    with profile.step("show_more"):
+                        browser.execute_script("arguments[0].click();", button)
+                        print("Clicked 'Show More' button")
+                        WebDriverWait(browser, WAIT_TIMEOUT).until(_button_expanded(button))
+        except TimeoutException:
+            increment("scrape.errors.show_more_timeout")
+            print("Show More button did not expand; using the visible description")
         except Exception as e:
+            increment("scrape.errors.show_more")
             print(f"Show More button handling: {e}")
 
-        description = browser.execute_script(js_remove_restrictions, description_container)
-
-        js_get_full_content = """
-        var element = arguments[0];
-        var parent = element.parentElement;
-        parent.style.maxHeight = 'none';
-        parent.style.overflow = 'visible';
-        element.style.maxHeight = 'none';
-        element.style.overflow = 'visible';
-        return element.innerText;
-        """
-
-        full_text = browser.execute_script(js_get_full_content, description_container)
-
-        if full_text and len(full_text) > len(description):
-            description = full_text
+        # innerHTML holds the full text whatever the truncation styles, so one
+        # round trip through the WebDriver bridge is enough
+        extraction_start = time.perf_counter()
+        description = browser.execute_script("return arguments[0].innerHTML;", description_container)
 
         if isinstance(description, str):
-            description = re.sub(r'<script[^>]*>.*?</script>', '', description, flags=re.DOTALL)
-            description = re.sub(r'<style[^>]*>.*?</style>', '', description, flags=re.DOTALL)
-            description = description.replace('<br>', '\n')
-            description = description.replace('<li>', '• ')
-            description = description.replace('</li>', '\n')
-            description = description.replace('<ul>', '\n').replace('</ul>', '\n')
-            description = description.replace('<p>', '').replace('</p>', '\n')
-            description = re.sub('<[^<]+?>', '', description)
-            description = re.sub(r'\n\s*\n', '\n\n', description)
-            description = re.sub(r' +', ' ', description)
-            description = description.strip()
+            with profile.step("html_to_text"):
+                description = html_to_text(description)
 
+        profile.record("description_extract", time.perf_counter() - extraction_start)
         return description if description else "No Description Found"
 
     except Exception as e:
+        increment("scrape.errors.description")
         print(f"Error extracting job description: {e}")
         return "No Description Found"
 
-def detect_job_cards_with_description(keyword, n=5):
+def iter_descriptions_parallel(job_listings, workers, rate_limiter=None, profile=None, pool=None):
     """
-    Scrape LinkedIn for job listings based on search parameters.
-    
+    Fill in job descriptions using a bounded pool of headless browsers.
+
+    Jobs that still need a description are put on a shared queue in result
+    order; each worker borrows a browser from the pool and takes the next
+    job whenever it is free, opening the job pages directly. A worker still
+    waiting for a browser holds no jobs, so the earliest jobs are always
+    the next to be opened. Jobs that already have a description are passed
+    through untouched. Jobs are yielded in their original order as soon as
+    each one (and every job before it) is done.
+
+    Args:
+        job_listings (list): Job summaries as returned by read_job_card
+        workers (int): Number of concurrent browsers; capped by the pool size
+        rate_limiter (RateLimiter): Shared limiter for page requests
+        profile (TimingProfile): Records the time spent in each step
+        pool (BrowserPool): Browsers to use (default: the shared pool)
+
+    Yields:
+        dict: Each job with its "description" filled in
+    """
+    if not job_listings:
+        return
+
+    done = [threading.Event() for _ in job_listings]
+    stop = threading.Event()
+
+    pending = queue.Queue()
+    for idx, job_data in enumerate(job_listings):
+        if "description" in job_data:
+            done[idx].set()
+        else:
+            pending.put(idx)
+    if pending.empty():
+        # Every description is already known: no browser is needed, or waited for
+        yield from job_listings
+        return
+
+    rate_limiter = rate_limiter or RateLimiter()
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    pool = pool or get_browser_pool()
+    workers = max(1, min(workers, pool.size, pending.qsize()))
+    running = [workers]
+    running_lock = threading.Lock()
+
+    def give_up(idx):
+        # Never leave the consumer waiting on a job nobody will open
+        job_listings[idx].setdefault("description", "No Description Found")
+        done[idx].set()
+
+    def work():
+        idx = None
+        try:
+            acquire_start = time.perf_counter()
+            with pool.acquire() as browser:
+                profile.record("browser_acquire", time.perf_counter() - acquire_start)
+                while not stop.is_set():
+                    try:
+                        idx = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    job_data = job_listings[idx]
+                    if not job_data.get("url"):
+                        job_data["description"] = "No Description Found"
+                    else:
+                        with profile.step("rate_limit"):
+                            rate_limiter.wait()
+                        with profile.step("card_total"):
+                            job_data["description"] = extract_job_description_from_url(browser, job_data["url"], profile)
+                        print(f"Successfully processed job: {job_data['title']}")
+                    done[idx].set()
+                    idx = None
+        finally:
+            if idx is not None:
+                give_up(idx)
+            with running_lock:
+                running[0] -= 1
+                last = running[0] == 0
+            if last:
+                # The last worker out settles whatever is still queued
+                while not pending.empty():
+                    give_up(pending.get_nowait())
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(work) for _ in range(workers)]
+        try:
+            for idx, job_data in enumerate(job_listings):
+                done[idx].wait()
+                yield job_data
+        finally:
+            stop.set()
+        for future in futures:
+            future.result()
+
+def extract_descriptions_parallel(job_listings, workers, rate_limiter=None, profile=None, pool=None):
+    """Fill in job descriptions in place; see iter_descriptions_parallel."""
+    for _ in iter_descriptions_parallel(job_listings, workers, rate_limiter, profile, pool):
+        pass
+
+def _filter_codes(labels, codes, name):
+    unknown = [label for label in labels if label not in codes]
+    if unknown:
+        raise ValueError(f"Unknown {name}: {', '.join(unknown)}")
+    return ",".join(sorted({codes[label] for label in labels}))
+
+def build_search_url(keyword, location=None, experience_levels=None, job_types=None):
+    """
+    Build the LinkedIn job search url for a keyword, with optional location and filters.
+
     Args:
         keyword (str): Job keyword or title to search for
-        n (int): Number of jobs to scrape (default: 5)
-        
+        location (str): Location to search in, e.g. "New York" or "Remote"
+        experience_levels (list): Labels of EXPERIENCE_LEVEL_CODES, e.g. ["Entry level"]
+        job_types (list): Labels of JOB_TYPE_CODES, e.g. ["Full-time", "Contract"]
+
     Returns:
-        list: List of job listings with details
+        str: Search url
     """
-    base_url = "https://www.linkedin.com/jobs/search"
-    formatted_keyword = keyword.replace(" ", "%20")
-    url = f"{base_url}?keywords={formatted_keyword}&trk=public_jobs_jobs-search-bar_search-submit&position=1&pageNum=0"
-    browser = setup_browser()
-    job_listings = []
+    params = {"keywords": keyword}
+    if location:
+        params["location"] = location
+    if experience_levels:
+        params["f_E"] = _filter_codes(experience_levels, EXPERIENCE_LEVEL_CODES, "experience level")
+    if job_types:
+        params["f_JT"] = _filter_codes(job_types, JOB_TYPE_CODES, "job type")
+    params.update({"trk": "public_jobs_jobs-search-bar_search-submit", "position": 1, "pageNum": 0})
+    return f"{SEARCH_URL}?{urlencode(params, quote_via=quote)}"
 
-    try:
-        browser.get(url)
-        print("Page loaded successfully.")
-        time.sleep(5)
+def load_more_cards(browser, loaded, profile=None):
+    """
+    Scroll the result list, clicking "See more jobs" if shown, until more than
+    `loaded` cards are on the page.
+
+    Returns:
+        bool: False when the search has no more results
+    """
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    with profile.step("load_more"):
+        browser.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        for button in browser.find_elements(By.CSS_SELECTOR, LOAD_MORE_SELECTOR):
+            if button.is_displayed():
+                browser.execute_script("arguments[0].click();", button)
+        try:
+            WebDriverWait(browser, WAIT_TIMEOUT).until(
+                lambda b: len(b.find_elements(By.CLASS_NAME, "base-card")) > loaded
+            )
+            return True
+        except TimeoutException:
+            return False
+
+def card_filter(experience_levels=None, job_types=None):
+    """
+    Local pre-filter for what LinkedIn's own filters let through, judged from
+    the result card alone so excluded jobs are never opened.
 
-        close_modal_if_present(browser)
+    Senior titles are dropped when only junior experience levels were asked
+    for, and internships when neither job type nor experience level asks
+    for them.
 
-        job_cards = WebDriverWait(browser, 10).until(
+    Returns:
+        callable: Takes a job summary and returns True to keep it, or None if
+            nothing needs filtering
+    """
+    checks = []
+    if experience_levels and set(experience_levels) <= JUNIOR_LEVELS:
+        checks.append(lambda job_data: not SENIOR_TITLE_PATTERN.search(job_data["title"]))
+    if job_types and "Internship" not in job_types and "Internship" not in (experience_levels or ()):
+        checks.append(lambda job_data: not INTERN_TITLE_PATTERN.search(job_data["title"]))
+    if not checks:
+        return None
+    return lambda job_data: all(check(job_data) for check in checks)
+
+def load_search_page(browser, keyword, location=None, profile=None, experience_levels=None, job_types=None):
+    """Open the search results for a keyword, location and filters and dismiss the sign-in modal."""
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    with profile.step("page_load"):
+        browser.get(build_search_url(keyword, location, experience_levels, job_types))
+        WebDriverWait(browser, WAIT_TIMEOUT).until(
             EC.presence_of_all_elements_located((By.CLASS_NAME, "base-card"))
         )
-        print(f"Number of job cards detected: {len(job_cards)}")
+    print("Page loaded successfully.")
+
+    close_modal_if_present(browser, profile)
+
+def collect_job_cards(keyword, n=5, location=None, profile=None, pool=None, experience_levels=None, job_types=None):
+    """
+    Read the summaries of the first n matching result cards of a search, without opening any job.
+
+    Args:
+        keyword (str): Job keyword or title to search for
+        n (int): Number of cards to keep (default: 5)
+        location (str): Location to search in (default: anywhere)
+        profile (TimingProfile): Records the time spent in each step
+        pool (BrowserPool): Warm browsers to borrow from (default: the shared pool)
+        experience_levels (list): Experience level filter (see build_search_url)
+        job_types (list): Job type filter (see build_search_url)
+
+    Returns:
+        list: Job summaries as returned by read_job_card, in result order
+    """
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    pool = pool or get_browser_pool()
+    keep = card_filter(experience_levels, job_types)
+    summaries = []
 
-        for idx, card in enumerate(job_cards[:n]):
+    acquire_start = time.perf_counter()
+    with pool.acquire() as browser:
+        profile.record("browser_acquire", time.perf_counter() - acquire_start)
+        load_search_page(browser, keyword, location, profile, experience_levels, job_types)
+
+        idx = 0
+        while len(summaries) < n:
+            job_cards = browser.find_elements(By.CLASS_NAME, "base-card")
+            if idx >= len(job_cards):
+                if not load_more_cards(browser, len(job_cards), profile):
+                    print(f"Search returned only {len(job_cards)} job cards")
+                    break
+                continue
+
+            idx += 1
             try:
-                print(f"\nProcessing Job Card {idx + 1}...")
-
-                job_data = {
-                    "title": card.find_element(By.CLASS_NAME, "base-search-card__title").text.strip(),
-                    "company": card.find_element(By.CLASS_NAME, "base-search-card__subtitle").find_element(By.TAG_NAME, "a").text.strip()
-                }
-
-                close_modal_if_present(browser)
-                job_data["description"] = extract_job_description(browser, card)
-
-                # Extract location if available
-                try:
-                    job_data["location"] = card.find_element(By.CLASS_NAME, "job-search-card__location").text.strip()
-                except:
-                    job_data["location"] = "Location not specified"
-                
-                # Extract date posted if available
-                try:
-                    job_data["date_posted"] = card.find_element(By.CSS_SELECTOR, "time.job-search-card__listdate").get_attribute("datetime")
-                except:
-                    job_data["date_posted"] = "Recently posted"
-
-                job_listings.append(job_data)
+                job_data = read_job_card(job_cards[idx - 1])
+                if keep and not keep(job_data):
+                    increment("scrape.cards_filtered")
+                    print(f"Skipping job outside the filters: {job_data['title']}")
+                    continue
+                summaries.append(job_data)
+            except Exception as e:
+                increment("scrape.errors.card")
+                print(f"Error reading job card {idx}: {e}")
+
+    return summaries
+
+def iter_job_cards(keyword, n=5, location=None, workers=1, requests_per_second=None, profile=None, pool=None,
+                   description_store=None, experience_levels=None, job_types=None):
+    """
+    Scrape LinkedIn job listings, yielding each job as soon as its description is extracted.
+
+    Scrolls the result list until n jobs have been kept or the search runs out.
+    Experience level and job type are filtered by LinkedIn; cards that still
+    do not fit (see card_filter) are skipped before they are clicked, and
+    postings whose description is already in the description store are not
+    opened at all.
+
+    Args:
+        keyword (str): Job keyword or title to search for
+        n (int): Number of jobs to scrape (default: 5)
+        location (str): Location to search in (default: anywhere)
+        workers (int): Number of browsers extracting descriptions concurrently (default: 1)
+        requests_per_second (float): Global limit on page requests across workers (default: unlimited)
+        profile (TimingProfile): Filled with per-step timings; a new one is used if omitted
+        pool (BrowserPool): Warm browsers to borrow from (default: the shared pool)
+        description_store (DescriptionStore): Known descriptions by job ID (default: the shared store)
+        experience_levels (list): Experience level filter (see build_search_url)
+        job_types (list): Job type filter (see build_search_url)
+
+    Yields:
+        dict: Job listing with details
+    """
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    pool = pool or get_browser_pool()
+    description_store = description_store or get_description_store()
+    rate_limiter = RateLimiter(requests_per_second)
+    keep = card_filter(experience_levels, job_types)
+
+    if workers > 1:
+        # Descriptions are fetched from the job pages once the search browser is released
+        summaries = collect_job_cards(keyword, n, location, profile, pool, experience_levels, job_types)
+        yield from iter_descriptions(summaries, workers, rate_limiter, profile, pool, description_store)
+        return
+
+    acquire_start = time.perf_counter()
+    with pool.acquire() as browser:
+        profile.record("browser_acquire", time.perf_counter() - acquire_start)
+        load_search_page(browser, keyword, location, profile, experience_levels, job_types)
+
+        idx = kept = 0
+        while kept < n:
+            job_cards = browser.find_elements(By.CLASS_NAME, "base-card")
+            if idx >= len(job_cards):
+                if not load_more_cards(browser, len(job_cards), profile):
+                    print(f"Search returned only {len(job_cards)} job cards")
+                    break
+                continue
+
+            card = job_cards[idx]
+            idx += 1
+            try:
+                print(f"\nProcessing Job Card {idx}...")
+
+                job_data = read_job_card(card)
+                if keep and not keep(job_data):
+                    increment("scrape.cards_filtered")
+                    print(f"Skipping job outside the filters: {job_data['title']}")
+                    continue
+                kept += 1
+
+                with profile.step("description_lookup"):
+                    known_description = description_store.get(job_data["job_id"])
+                if known_description:
+                    job_data["description"] = known_description
+                    increment("scrape.description_store_hits")
+                    print(f"Using stored description for job: {job_data['title']}")
+                    yield job_data
+                    continue
+
+                close_modal_if_present(browser, profile)
+                with profile.step("rate_limit"):
+                    rate_limiter.wait()
+                with profile.step("card_total"):
+                    job_data["description"] = extract_job_description(browser, card, profile)
+                description_store.put(job_data["job_id"], job_data["description"])
+
                 print(f"Successfully processed job: {job_data['title']}")
+                yield job_data
 
             except Exception as e:
-                print(f"Error processing job card {idx + 1}: {e}")
+                increment("scrape.errors.card")
+                print(f"Error processing job card {idx}: {e}")
 
-            time.sleep(2)
+def iter_descriptions(summaries, workers, rate_limiter=None, profile=None, pool=None, description_store=None):
+    """
+    Fill in descriptions for job summaries, taking known ones from the description
+    store and opening the remaining job pages in parallel (see iter_descriptions_parallel).
 
-    except Exception as e:
-        print(f"An error occurred: {e}")
-    finally:
-        browser.quit()
+    Yields:
+        dict: Each job with its "description" filled in, in the original order
+    """
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    description_store = description_store or get_description_store()
+
+    with profile.step("description_lookup"):
+        known = description_store.get_many(job_data["job_id"] for job_data in summaries)
+    for job_data in summaries:
+        if job_data["job_id"] in known:
+            job_data["description"] = known[job_data["job_id"]]
+    if summaries:
+        increment("scrape.description_store_hits", len(known))
+        print(f"Using stored descriptions for {len(known)} of {len(summaries)} jobs")
+
+    for job_data in iter_descriptions_parallel(summaries, workers, rate_limiter, profile, pool):
+        if job_data["job_id"] not in known:
+            description_store.put(job_data["job_id"], job_data["description"])
+        yield job_data
 
-    filename = f"linkedin_jobs.json"
+def save_job_listings(job_listings, filename=JOBS_PATH):
+    """
+    Append scraped job listings to the JSONL job file.
 
+    Only this scrape's jobs are written; earlier scrapes already in the file
+    are not read or rewritten. Load the file with job_store.JobStore(filename).
+    """
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(job_listings, f, indent=2, ensure_ascii=False)
+        JobStore.from_jobs(job_listings).flush(filename)
         print(f"\nJob listings saved to {filename}")
     except Exception as e:
         print(f"Error saving to JSON: {e}")
 
+def detect_job_cards_with_description(keyword, n=5, location=None, workers=1, requests_per_second=None, profile=None, pool=None,
+                                      description_store=None, experience_levels=None, job_types=None):
+    """
+    Scrape LinkedIn for job listings based on search parameters.
+    
+    Args:
+        keyword (str): Job keyword or title to search for
+        n (int): Number of jobs to scrape (default: 5)
+        location (str): Location to search in (default: anywhere)
+        workers (int): Number of browsers extracting descriptions concurrently (default: 1)
+        requests_per_second (float): Global limit on page requests across workers (default: unlimited)
+        profile (TimingProfile): Filled with per-step timings; a new one is used if omitted
+        pool (BrowserPool): Warm browsers to borrow from (default: the shared pool)
+        description_store (DescriptionStore): Known descriptions by job ID (default: the shared store)
+        experience_levels (list): Experience level filter, e.g. ["Entry level", "Associate"]
+        job_types (list): Job type filter, e.g. ["Full-time"]
+        
+    Returns:
+        list: List of job listings with details
+    """
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    job_listings = []
+
+    try:
+        for job_data in iter_job_cards(keyword, n, location, workers, requests_per_second, profile, pool,
+                                       description_store, experience_levels, job_types):
+            job_listings.append(job_data)
+    except Exception as e:
+        increment("scrape.errors.search")
+        print(f"An error occurred: {e}")
+
+    print(f"\nTiming report:\n{profile.report()}")
+    save_job_listings(job_listings)
+
     return job_listings
 
 
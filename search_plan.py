@@ -0,0 +1,186 @@
+import re
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from metrics import increment
+
+# Separators accepted between several keywords or locations in one input
+TERM_SEPARATORS = r"[,;\n]"
+
+
+def split_terms(text):
+    """
+    Split a comma, semicolon or newline separated input into search terms.
+
+    "Data Scientist, ML Engineer" gives ["Data Scientist", "ML Engineer"].
+    Repeated terms (ignoring case and spacing) are dropped.
+
+    Returns:
+        list: Terms in input order
+    """
+    terms, seen = [], set()
+    for term in re.split(TERM_SEPARATORS, text or ""):
+        term = " ".join(term.split())
+        if term and term.lower() not in seen:
+            seen.add(term.lower())
+            terms.append(term)
+    return terms
+
+
+def as_terms(value):
+    """Keyword or location parameter as a list of terms; None means anywhere."""
+    if isinstance(value, (list, tuple)):
+        return list(value) or [None]
+    return [value]
+
+
+class SearchPlan:
+    """
+    Several searches run as one: every keyword in every location.
+
+    Args:
+        keywords (list): Job keywords or titles, e.g. ["Data Scientist", "ML Engineer"]
+        locations (list): Locations, e.g. ["Remote", "New York"] (default: anywhere)
+        n (int): Jobs returned in total; each query also reads up to n cards
+        experience_levels (list): Experience level filter applied to every query
+        job_types (list): Job type filter applied to every query
+    """
+    def __init__(self, keywords, locations=None, n=5, experience_levels=None, job_types=None):
+        self.keywords = as_terms(keywords)
+        self.locations = as_terms(locations)
+        self.n = n
+        self.experience_levels = experience_levels
+        self.job_types = job_types
+
+    @classmethod
+    def from_params(cls, params):
+        """Plan for search parameters as built by scrape_cache.search_params."""
+        return cls(params["keyword"], params["location"], params["n"], params.get("experience_levels"),
+                   params.get("job_types"))
+
+    @property
+    def queries(self):
+        """(keyword, location) pairs, keyword by keyword."""
+        return [(keyword, location) for keyword in self.keywords for location in self.locations]
+
+    def __len__(self):
+        return len(self.queries)
+
+
+def job_key(job_data):
+    """
+    Identity of a posting across searches: its LinkedIn job ID, or a hash of the
+    normalized title, company and location for cards that carry no ID.
+
+    Also the key of jobs in job_index.JobIndex, so it stays free of heavy imports.
+
+    Args:
+        job_data (dict): Job summary or record as written by the scraper
+
+    Returns:
+        str: The job ID, or "sha1:" and a hex digest
+    """
+    if job_data.get("job_id"):
+        return job_data["job_id"]
+    normalized = "|".join(" ".join(str(job_data.get(field) or "").lower().split())
+                          for field in ("title", "company", "location"))
+    return "sha1:" + hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def merge_job_cards(result_lists):
+    """
+    Merge per-query results, taking the best remaining card of each query in turn
+    and dropping postings already taken from an earlier query.
+
+    Args:
+        result_lists (list): One list of job summaries per query, in result order
+
+    Returns:
+        list: Unique job summaries
+    """
+    merged, seen = [], set()
+    for job_data in (job for round_ in zip_longest(*result_lists) for job in round_ if job is not None):
+        key = job_key(job_data)
+        if key in seen:
+            increment("scrape.duplicates_skipped")
+            continue
+        seen.add(key)
+        merged.append(job_data)
+    return merged
+
+
+def iter_search_plan(plan, workers=1, requests_per_second=None, profile=None, pool=None, description_store=None):
+    """
+    Run every query of a search plan and yield the merged, de-duplicated jobs with descriptions.
+
+    The queries' result cards are read concurrently, each query on its own
+    browser from the pool. Overlapping postings are dropped before any job is
+    opened, so a posting found by several queries has its description
+    extracted once, and only the first plan.n merged jobs are opened at all.
+
+    Args:
+        plan (SearchPlan): Keywords, locations, filters and number of jobs
+        workers (int): Number of browsers extracting descriptions concurrently (default: 1)
+        requests_per_second (float): Global limit on page requests across workers (default: unlimited)
+        profile (TimingProfile): Filled with per-step timings; a new one is used if omitted
+        pool (BrowserPool): Warm browsers to borrow from (default: the shared pool)
+        description_store (DescriptionStore): Known descriptions by job ID (default: the shared store)
+
+    Yields:
+        dict: Job listing with details
+    """
+    # Selenium is loaded by the first scrape, not when the app starts (see warmup.py)
+    from browser_pool import get_browser_pool
+    from scraper import SCRAPE_PREFIX, RateLimiter, TimingProfile, collect_job_cards, iter_descriptions
+
+    profile = profile or TimingProfile(SCRAPE_PREFIX)
+    pool = pool or get_browser_pool()
+    queries = plan.queries
+
+    result_lists, errors = [], []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(queries), pool.size))) as executor:
+        futures = [executor.submit(collect_job_cards, keyword, plan.n, location, profile, pool,
+                                   plan.experience_levels, plan.job_types)
+                   for keyword, location in queries]
+        for (keyword, location), future in zip(queries, futures):
+            try:
+                result_lists.append(future.result())
+            except Exception as e:
+                increment("scrape.errors.search")
+                print(f"Search for {keyword!r} in {location or 'any location'} failed: {e}")
+                errors.append(e)
+    if errors and len(errors) == len(queries):
+        raise errors[0]
+
+    with profile.step("merge"):
+        summaries = merge_job_cards(result_lists)
+    print(f"{len(queries)} searches found {sum(map(len, result_lists))} cards, {len(summaries)} unique")
+    summaries = summaries[:plan.n]
+
+    yield from iter_descriptions(summaries, workers, RateLimiter(requests_per_second), profile, pool,
+                                 description_store)
+
+
+def iter_search(keyword, n=5, location=None, experience_levels=None, job_types=None, **scraper_kwargs):
+    """
+    Scrape one search, or a search plan when keyword or location is a list.
+
+    Args:
+        keyword (str or list): Job keyword(s)
+        n (int): Number of jobs to return
+        location (str or list): Location(s) (default: anywhere)
+        experience_levels (list): Experience level filter (see scraper.build_search_url)
+        job_types (list): Job type filter (see scraper.build_search_url)
+        **scraper_kwargs: Passed through to iter_job_cards / iter_search_plan
+
+    Yields:
+        dict: Job listing with details
+    """
+    plan = SearchPlan(keyword, location, n, experience_levels, job_types)
+    if len(plan) > 1:
+        yield from iter_search_plan(plan, **scraper_kwargs)
+    else:
+        from scraper import iter_job_cards
+
+        yield from iter_job_cards(plan.keywords[0], n, plan.locations[0], experience_levels=experience_levels,
+                                  job_types=job_types, **scraper_kwargs)
@@ -0,0 +1,174 @@
+import re
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+_WORD_RE = re.compile(r"\w+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_skill(text):
+    """Lowercase a skill name and collapse internal whitespace."""
+    return _SPACE_RE.sub(" ", text.strip().lower())
+
+
+def _trie_pattern(node):
+    """
+    Turn a character trie into a prefix-factored regular expression.
+
+    Alternatives sharing a prefix are merged, so the regex engine walks the
+    trie once per text position instead of trying every skill in turn.
+    """
+    if "" in node and len(node) == 1:
+        return ""
+
+    branches = []
+    optional = False
+    for char, child in sorted(node.items()):
+        if char == "":
+            optional = True
+            continue
+        head = r"\s+" if char == " " else re.escape(char)
+        branches.append(head + _trie_pattern(child))
+
+    if len(branches) == 1 and not optional:
+        return branches[0]
+
+    pattern = "(?:" + "|".join(branches) + ")"
+    return pattern + "?" if optional else pattern
+
+
+def load_taxonomy(path):
+    """
+    Load a skill taxonomy from a file.
+
+    JSON files may hold a list of skill names or an object mapping each skill
+    to a list of synonyms. Any other file is read as text with one skill per
+    line, synonyms separated by "|" and "#" starting a comment, e.g.:
+
+        Machine Learning | ML | machine-learning
+
+    Args:
+        path (str): Path of the taxonomy file
+
+    Returns:
+        dict: Mapping of skill name to a list of synonyms
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".json"):
+            data = json.load(f)
+            if isinstance(data, list):
+                return {skill: [] for skill in data}
+            return {skill: list(synonyms or []) for skill, synonyms in data.items()}
+
+        taxonomy = {}
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            names = [name.strip() for name in line.split("|") if name.strip()]
+            taxonomy.setdefault(names[0], []).extend(names[1:])
+        return taxonomy
+
+
+class SkillExtractor:
+    """
+    Find taxonomy skills in free text with one precompiled regular expression.
+
+    Matches respect word boundaries ("Sales" does not match "wholesale"), may
+    overlap ("General Business Development" reports both "General Business"
+    and "Business Development"), and a skill whose name contains another
+    skill as whole words also reports the shorter one ("Product Management"
+    implies "Management").
+    """
+    def __init__(self, skills, cache_size=4096):
+        """
+        Args:
+            skills (list or dict): Skill names, or a mapping of skill name to synonyms
+            cache_size (int): Number of texts kept by extract_cached
+        """
+        if not isinstance(skills, dict):
+            skills = {skill: [] for skill in skills}
+
+        self.aliases = {}
+        for skill, synonyms in skills.items():
+            canonical = normalize_skill(skill)
+            for alias in [skill, *synonyms]:
+                alias = normalize_skill(alias)
+                if alias:
+                    self.aliases.setdefault(alias, canonical)
+
+        self.implied = {alias: self._contained_skills(alias) for alias in self.aliases}
+
+        trie = {}
+        for alias in self.aliases:
+            node = trie
+            for char in alias:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        body = _trie_pattern(trie) if trie else "(?!)"
+        # A zero-width lookahead consumes nothing, so every word start is tried and overlapping
+        # skills are all found ("general business development" has "general business" and
+        # "business development"); the greedy trie gives the longest alias at each start
+        self.pattern = re.compile(r"(?<!\w)(?=(" + body + r")(?!\w))", re.IGNORECASE)
+
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        # One extractor (resume_matcher.SKILL_EXTRACTOR) serves every session's thread
+        self._cache_lock = threading.Lock()
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Build an extractor from a taxonomy file (see load_taxonomy)."""
+        return cls(load_taxonomy(path), **kwargs)
+
+    def _contained_skills(self, alias):
+        """The alias's own skill, and canonical skills whose aliases appear as whole words inside it."""
+        spans = [match.span() for match in _WORD_RE.finditer(alias)]
+        # Word spans alone miss aliases with punctuation such as "c++" or ".net"
+        found = {self.aliases[alias]}
+        for i, (start, _) in enumerate(spans):
+            for _, end in spans[i:]:
+                canonical = self.aliases.get(alias[start:end])
+                if canonical:
+                    found.add(canonical)
+        return found
+
+    def extract(self, text):
+        """
+        Extract the skills mentioned in a text in a single scan, including overlapping ones.
+
+        Args:
+            text (str): Text to search
+
+        Returns:
+            set: Lowercased canonical skill names
+        """
+        found = set()
+        for match in self.pattern.finditer(text):
+            alias = normalize_skill(match.group(1))
+            found |= self.implied.get(alias, ())
+        return found
+
+    def extract_cached(self, text):
+        """
+        Same as extract, memoised by a hash of the text.
+
+        Job descriptions are matched against many resumes, so their skill sets
+        are worth keeping around between calls.
+        """
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._cache_lock:
+            skills = self._cache.get(key)
+            if skills is not None:
+                self._cache.move_to_end(key)
+                return set(skills)
+
+        skills = frozenset(self.extract(text))
+        with self._cache_lock:
+            self._cache[key] = skills
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return set(skills)
@@ -0,0 +1,50 @@
+import time
+import importlib
+import threading
+from metrics import REGISTRY
+
+# Heavy dependencies the app only imports on first use, in the order they are
+# usually needed: matching, then the scraper, then resume parsing.
+WARMUP_MODULES = (
+    "sklearn.feature_extraction.text",
+    "sklearn.metrics.pairwise",
+    "scraper",
+    "PyPDF2",
+    "docx2txt",
+    "pandas"
+)
+
+_started = False
+_started_lock = threading.Lock()
+
+
+def _preload(modules):
+    for name in modules:
+        start = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"Warm-up import of {name} failed: {e}")
+            continue
+        REGISTRY.observe(f"warmup.{name}", time.perf_counter() - start)
+
+
+def start_warmup(modules=WARMUP_MODULES):
+    """
+    Import the app's heavy dependencies on a background thread, once per process.
+
+    Called after the first page has rendered, so the first paint does not
+    wait for scikit-learn, Selenium or PyPDF2, while the first search or
+    upload usually finds them already loaded. A module still being imported
+    when it is first used is simply waited for by Python's import lock.
+
+    Returns:
+        bool: True if this call started the warm-up
+    """
+    global _started
+    with _started_lock:
+        if _started:
+            return False
+        _started = True
+    threading.Thread(target=_preload, args=(modules,), name="warmup", daemon=True).start()
+    return True